@@ -5,22 +5,20 @@
 __author__ = 'Eric J. Harlan'
 __license__ = "GPLv3"
 
-class CalendarEvent():
-    def __init__(self, event_name, start_date, end_date, all_day_event, multi_day_event):
-        self.event_name = event_name
-        self.start_date = start_date
-        self.end_date = end_date
-        self.all_day_event = all_day_event
-        self.multi_day_event = multi_day_event
+from dataclasses import dataclass
+from datetime import datetime
 
-    def __eq__(self, right_operand):
-        return (
-            self.event_name == right_operand.event_name
-            and self.start_date == right_operand.start_date
-            and self.end_date == right_operand.end_date
-            and self.all_day_event == right_operand.all_day_event
-            and self.multi_day_event == right_operand.multi_day_event
-        )
+@dataclass(slots=True, frozen=True)
+class CalendarEvent():
+    '''
+        Immutable so that events can be hashed and stored in sets
+        eq and hash are generated from all five fields
+    '''
+    event_name: str
+    start_date: datetime
+    end_date: datetime
+    all_day_event: bool
+    multi_day_event: bool
 
     def __repr__(self):
         return (
@@ -39,4 +37,4 @@ class CalendarEvent():
         elif self.start_date is None:
             return f'{self.event_name}: Until {self.end_date}'
         else:
-            return f'{self.event_name}: {self.start_date} - {self.end_date}'
\ No newline at end of file
+            return f'{self.event_name}: {self.start_date} - {self.end_date}'
@@ -6,6 +6,8 @@ __author__ = 'Eric J. Harlan'
 __license__ = "GPLv3"
 
 from abc import ABC, abstractmethod
+import bisect
+from collections import defaultdict
 from datetime import datetime, date, time, timedelta
 
 from calendar_api.calendarevents import CalendarEvent
@@ -17,7 +19,14 @@ class CalendarAPI(ABC):
     '''
     def __init__(self, calendar_service, time_zone):
         self.calendar_service = calendar_service
-        self.events = {}
+        # Events keyed by the date's ordinal (see _key), each day holds a list of events
+        self.events = defaultdict(list)
+        # Set of every event on the calendar, for fast membership checks
+        self._event_set = set()
+        # Ordinals of the dates that have events, kept in ascending order
+        self._days = []
+        # XOR of every event's hash, lets __eq__ rule out changes cheaply
+        self._signature = 0
         self.next_refresh = datetime.min
         self.time_zone = time_zone
 
@@ -29,31 +38,43 @@ class CalendarAPI(ABC):
         if not isinstance(right_operand, CalendarEvent):
             raise TypeError(f'Expected a CalendarEvent object, received {type(right_operand)}')
 
-        for key, val in self.events.items():
-            for item in val:
-                if right_operand == item:
-                    return True
-
-        return False
+        return right_operand in self._event_set
 
     def __eq__(self, right_operand):
+        # Different signatures mean different events
+        # Matching signatures could be a collision, so fall through to a full compare
+        if self._signature != right_operand._signature:
+            return False
+
+        # Each event's date bucket is derived from the event itself,
+        # so comparing the event sets is equivalent to comparing the
+        # events dictionaries, without walking every list element by element
         return (
             self.calendar_service.casefold() == right_operand.calendar_service.casefold()
-            and self.events == right_operand.events
+            and self._event_set == right_operand._event_set
         )
 
     def __getitem__(self, key):
-        return self.events[key]
+        # events is a defaultdict, so use get to keep lookups from adding empty days
+        return self.events.get(self._key(key), [])
 
     def __iter__(self):
-        # Iterate through events dictionary, sorting key (date) ascending
-        for key, val in sorted(self.events.items(), key= lambda x: str(x[0])):
-            # Sort the day's events
-            val.sort(key= lambda x: (x.start_date, x.end_date))
-            # Multi-day events in progress may include events from previous days
-            # Exclude them
-            if key >= datetime.now().date():
-                yield key, val
+        # Multi-day events in progress may include events from previous days
+        # _days is already sorted, so skip straight to today
+        first_day = bisect.bisect_left(self._days, self._key(datetime.now()))
+
+        # Each day's events are already sorted by _insert_event
+        for key in self._days[first_day:]:
+            yield date.fromordinal(key), self.events[key]
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        # String hashes are salted per process, so a signature restored
+        # from a pickled session won't match. Rebuild it
+        self._signature = 0
+        for event in self._event_set:
+            self._signature ^= hash(event)
 
     def __len__(self):
         total_events = 0
@@ -63,15 +84,31 @@ class CalendarAPI(ABC):
         return total_events
 
     def keys(self):
-        return self.events.keys()
+        return [date.fromordinal(key) for key in self.events.keys()]
 
     def items(self):
-        return self.events.items()
+        return [(date.fromordinal(key), val) for key, val in self.events.items()]
 
     def values(self):
         return self.events.values()
 
 
+    @staticmethod
+    def _key(day):
+        '''
+            Returns the events dictionary key for a date or datetime
+            Day ordinals are plain ints, which hash and compare faster than dates
+        '''
+        return day.toordinal()
+
+    @staticmethod
+    def _event_sort_key(event):
+        '''
+            Sort key for the events on a given day
+            Split multi-day events can be missing a start or end time
+        '''
+        return (event.start_date or datetime.min, event.end_date or datetime.max)
+
     @staticmethod
     def calendar_days_duration(start_date, end_date):
         '''
@@ -82,22 +119,15 @@ class CalendarAPI(ABC):
         if not (isinstance(end_date, datetime) or isinstance(end_date, date)):
             raise TypeError(f'end_date: Expected date or datetime. Received {type(end_date)}')
 
-        # Set start_date to a datetime with midnight as the time
+        # Only the calendar dates matter, so drop the times and count
+        # the days between them, rather than building datetimes at the
+        # start and end of each day
         if isinstance(start_date, datetime):
-            # Set start_date to midnight
-            start_date = start_date.replace(hour = 0, minute = 0, second = 0, microsecond = 0)
-        else:
-            start_date = datetime.combine(start_date, time.min)
-
+            start_date = start_date.date()
         if isinstance(end_date, datetime):
-            # Set start_date to midnight
-            end_date = end_date.replace(hour = 23, minute = 59, second = 59, microsecond = 0)
-        else:
-            end_date = datetime.combine(end_date, time.max)
-
-        td = end_date - start_date
+            end_date = end_date.date()
 
-        return td.days + 1
+        return (end_date - start_date).days + 1
 
     @staticmethod
     def date_range(start_date, end_date):
@@ -125,11 +155,38 @@ class CalendarAPI(ABC):
             end_date = end_date.date()
             return_datetime = True
 
+        # Step through day ordinals rather than adding a timedelta each day
+        start_ordinal = start_date.toordinal()
         for i in range((end_date - start_date).days):
             if return_datetime:
-                yield i, datetime.combine(start_date + timedelta(days= i), time.min)
+                yield i, datetime.combine(date.fromordinal(start_ordinal + i), time.min)
             else:
-                yield i, start_date + timedelta(days= i)
+                yield i, date.fromordinal(start_ordinal + i)
+
+    def _insert_event(self, event_date, new_event):
+        '''
+            Adds a CalendarEvent to the list for event_date
+            Days and each day's events are inserted in sorted order
+            so that __iter__ doesn't need to sort anything
+        '''
+        key = self._key(event_date)
+        days_events = self.events[key]
+        # Lists are only created here, so an empty list is a new day
+        if not days_events:
+            bisect.insort(self._days, key)
+
+        bisect.insort(days_events, new_event, key= self._event_sort_key)
+        self._event_set.add(new_event)
+        self._signature ^= hash(new_event)
+
+    def _replace_events(self, new_calendar):
+        '''
+            Replaces this calendar's events with the events from new_calendar
+        '''
+        self.events = new_calendar.events
+        self._event_set = new_calendar._event_set
+        self._days = new_calendar._days
+        self._signature = new_calendar._signature
 
     def _add_new_event(self, event_name, start_date, end_date, all_day_event):
         '''
@@ -141,45 +198,35 @@ class CalendarAPI(ABC):
         # Google puts the end date as the next day for all day events
         # Giving us a duration of 1 day
         if duration_days < 2:
-            # If the events dictionary doesn't have an entry for this date
-            # create an empty list
-            if start_date.date() not in self.events:
-                self.events[start_date.date()] = []
-
             new_event = CalendarEvent(event_name, start_date, end_date
                                     , all_day_event, False)
 
             # Check to see if the event is already on the calendar
             # If not, add the event to the dictonary, using the start date as the key
             if new_event not in self:
-                self.events[start_date.date()].append(new_event)
+                self._insert_event(start_date.date(), new_event)
         else:
+            # These don't change from day to day, work them out once
+            start_day = start_date.date()
+            end_day = end_date.date()
+            partial_start_day = start_date.time() != time.min
+            partial_end_day = end_date.time() != time.min
+
             # Loop through the days in the event, adding an event for each day
-            for i, event_date in self.date_range(start_date, end_date + timedelta(days=1)):
-                if event_date not in self.events:
-                    self.events[event_date.date()] = []
-
-                if event_date.date() == start_date.date():
-                    if start_date.time() == time(0, 0):
-                        event_start = event_date
-                        event_end = event_date
-                        all_day_event = True
-                    else:
-                        event_start = datetime.combine(event_date.date(), start_date.time())
-                        event_end = None
-                        all_day_event = False
-                elif event_date.date() == end_date.date():
-                    if end_date.time() == time(0, 0):
-                        event_start = event_date
-                        event_end = event_date
-                        all_day_event = True
-                    else:
-                        event_start = None
-                        event_end = datetime.combine(event_date.date(), end_date.time())
-                        all_day_event = False
+            # The first and last days are all day, unless the event starts or ends
+            # partway through the day
+            for i, event_day in self.date_range(start_day, end_day + timedelta(days=1)):
+                if event_day == start_day and partial_start_day:
+                    event_start = start_date
+                    event_end = None
+                    all_day_event = False
+                elif event_day == end_day and partial_end_day:
+                    event_start = None
+                    event_end = end_date
+                    all_day_event = False
                 else:
-                    event_start = event_date
-                    event_end = event_date
+                    event_start = datetime.combine(event_day, time.min)
+                    event_end = event_start
                     all_day_event = True
 
                 new_event = CalendarEvent(
@@ -192,7 +239,7 @@ class CalendarAPI(ABC):
                 # Check to see if the event is already on the calendar
                 # If not, add the event to the dictonary, using the start date as the key
                 if new_event not in self:
-                    self.events[event_date.date()].append(new_event)
+                    self._insert_event(event_day, new_event)
 
     def add_event(self, *args):
         '''
@@ -206,12 +253,13 @@ class CalendarAPI(ABC):
                     end_date: The end datetime
                     all_day_event: Boolean for whether the event is an all day event
         '''
-        if len(args) == 1 and type(args[0]) == CalendarEvent:
+        if len(args) == 1 and isinstance(args[0], CalendarEvent):
+            event = args[0]
             self._add_new_event(
-                                args[0].event_name
-                                , args[0].start_date
-                                , args[0].end_date
-                                , args[0].all_day_event
+                                event.event_name
+                                , event.start_date
+                                , event.end_date
+                                , event.all_day_event
             )
         elif len(args) == 4:
             self._add_new_event(
@@ -33,6 +33,20 @@ class GoogleCalendar(CalendarAPI):
             , time_zone= time_zone
         )
 
+        # Credentials are kept between refreshes, token.pickle is only read
+        # when there are no credentials yet
+        self._creds = None
+
+    def __getstate__(self):
+        '''
+            The calendar is pickled with the session
+            Leave the credentials out, so the OAuth tokens are only stored in
+            token.pickle. They're loaded again the first time they're needed
+        '''
+        state = self.__dict__.copy()
+        state['_creds'] = None
+        return state
+
     def _get_credentials(self):
         '''
             Checks to see if pickle.token exists and is valid
@@ -44,18 +58,22 @@ class GoogleCalendar(CalendarAPI):
         '''
         log.debug('Entering _get_credentials()')
 
+        if self._creds and self._creds.valid:
+            log.debug('Exiting _get_credentials() with cached credentials')
+            return self._creds
+
         # If modifying these scopes, delete the file token.pickle.
         SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 
         folder = Path(__file__).resolve().parent
 
-        creds = None
+        creds = self._creds
         # The file token.pickle stores the user's access and refresh tokens, and is
         # created automatically when the authorization flow completes for the firsist
         # time.
         token_path = folder / 'token.pickle'
 
-        if token_path.is_file():
+        if not creds and token_path.is_file():
             with open(token_path, 'rb') as token:
                 log.debug('Token exists, opening file')
                 creds = pickle.load(token)
@@ -76,6 +94,8 @@ class GoogleCalendar(CalendarAPI):
             with open(token_path, 'wb') as token:
                 pickle.dump(creds, token)
 
+        self._creds = creds
+
         log.debug('Exiting _get_credentials()')
         return creds
 
@@ -92,7 +112,8 @@ class GoogleCalendar(CalendarAPI):
         page_token = None
         while True:
             #pylint: disable=no-member
-            calendar_list = calendar_service.calendarList().list(pageToken=page_token).execute()
+            calendar_list = calendar_service.calendarList().list(pageToken=page_token
+                                                , fields='items(id,summary),nextPageToken').execute()
             for item in calendar_list['items']:
                 if item['summary'] not in excluded_calendars:
                     calendar_ids.append(item['id'])
@@ -108,7 +129,7 @@ class GoogleCalendar(CalendarAPI):
             Hits the Google Calendar (read-only) API and pulls the next 5 events
             from each calendar.
 
-            Updates the events dictionary
+            Returns the list of events, and whether every calendar's request succeeded
         '''
         log.debug('Entering _get_events()')
 
@@ -123,14 +144,32 @@ class GoogleCalendar(CalendarAPI):
         now = datetime.utcnow().isoformat() + 'Z' # 'Z' indicates UTC time
 
         gcalendar_items = []
+        failed_calendars = []
+
+        def _add_items(request_id, response, exception):
+            ''' Callback for each request in the batch '''
+            if exception is not None:
+                log.error(f'Events request for calendar {request_id} failed: {exception}')
+                failed_calendars.append(request_id)
+            else:
+                gcalendar_items.extend(response.get('items', []))
+
+        # Send every calendar's events request in a single batched HTTP call
+        # Only request the fields that are used, to keep the responses small
+        # Google handles the requests in the batch in parallel, so there's no need
+        # for threads or asyncio here. The credential and calendar list calls
+        # above each depend on the previous result, so they stay sequential
+        batch = calendar_service.new_batch_http_request(callback=_add_items)
         for cal in calendar_ids:
             #pylint: disable=no-member
-            events_result = calendar_service.events().list(calendarId=cal
+            batch.add(calendar_service.events().list(calendarId=cal
                                                 , timeMin=now, maxResults=10
                                                 , singleEvents=True
                                                 , timeZone=self.time_zone
-                                                , orderBy='startTime').execute()
-            gcalendar_items.extend(events_result.get('items', []))
+                                                , orderBy='startTime'
+                                                , fields='items(summary,start,end)')
+                    , request_id=cal)
+        batch.execute()
 
         events = []
         for item in gcalendar_items:
@@ -141,8 +180,8 @@ class GoogleCalendar(CalendarAPI):
                     start_date_raw = item['start'].get('date')
                     end_date_raw = item['end'].get('date')
 
-                    start_date = datetime.strptime(start_date_raw, '%Y-%m-%d')
-                    end_date = datetime.strptime(end_date_raw, '%Y-%m-%d')
+                    start_date = datetime.fromisoformat(start_date_raw)
+                    end_date = datetime.fromisoformat(end_date_raw)
 
                     # For all day events, Google returns the day after
                     # Subtract a day to correct
@@ -152,12 +191,11 @@ class GoogleCalendar(CalendarAPI):
                     start_date_raw = item['start'].get('dateTime')
                     end_date_raw = item['end'].get('dateTime')
 
-                    start_date = datetime.strptime(start_date_raw, '%Y-%m-%dT%H:%M:%S%z')
-                    end_date = datetime.strptime(end_date_raw, '%Y-%m-%dT%H:%M:%S%z')
-
-                    # TZ Conversion handed by Google, remove tzinfo so items can be sorted
-                    start_date = start_date.replace(tzinfo=None)
-                    end_date = end_date.replace(tzinfo=None)
+                    # TZ Conversion handed by Google, drop the UTC offset so items can be sorted
+                    # Parsing only the YYYY-MM-DDTHH:MM:SS portion gives a naive datetime
+                    # without building an aware datetime and a tz-stripped copy
+                    start_date = datetime.fromisoformat(start_date_raw[:19])
+                    end_date = datetime.fromisoformat(end_date_raw[:19])
                     all_day_event = False
 
                 events.append(CalendarEvent(
@@ -170,7 +208,7 @@ class GoogleCalendar(CalendarAPI):
 
         # events.sort(key=lambda x: x.start_date)
         log.debug('Exiting _get_events()')
-        return events
+        return events, not failed_calendars
 
     def refresh(self):
         log.debug('Entering refresh()')
@@ -178,16 +216,22 @@ class GoogleCalendar(CalendarAPI):
         has_changed = False
 
         if datetime.now() >= self.next_refresh:
-            new_events = self._get_events()
+            new_events, all_calendars_loaded = self._get_events()
 
-            new_calendar = GoogleCalendar(self.time_zone)
-            for item in new_events:
-                new_calendar.add_event(item)
-
-            if self != new_calendar:
-                has_changed = True
+            # A calendar whose request failed would be missing from the new events
+            # Keep showing the previous events until every calendar loads
+            if not all_calendars_loaded:
+                log.error('Not every calendar loaded, keeping the previous events.')
+            else:
+                new_calendar = GoogleCalendar(self.time_zone)
                 for item in new_events:
-                    self.add_event(item)
+                    new_calendar.add_event(item)
+
+                # Swap in the freshly built events rather than adding
+                # every event to this calendar a second time
+                if self != new_calendar:
+                    has_changed = True
+                    self._replace_events(new_calendar)
 
         self.next_refresh = datetime.now() + timedelta(minutes= 50)
 
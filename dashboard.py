@@ -13,8 +13,12 @@ import forecast_api
 import calendar_api
 import display_controller
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime, time, timedelta
 import drawinghelpers as dh
+import functools
+import hashlib
 import logging
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
@@ -27,20 +31,191 @@ import os
 
 log = logging.getLogger(__name__)
 
+# Stored in dashboard.pickle, increment when a pickled class changes shape
+# so that sessions saved by an older version are ignored
+SESSION_VERSION = 20
+
+# Alignment aliases
+_TOP = dh.VerticalAlignment.TOP
+_MIDDLE = dh.VerticalAlignment.MIDDLE
+_BOTTOM = dh.VerticalAlignment.BOTTOM
+
+_LEFT = dh.HorizontalAlignment.LEFT
+_CENTER = dh.HorizontalAlignment.CENTER
+_RIGHT = dh.HorizontalAlignment.RIGHT
+
+# Layout, as ((start_x, start_y), (end_x, end_y)) boxes
+# Sums are the widths and heights of the grid cells a box spans
+
+# Now panel
+# Columns: x 26 w 62, x 88 w 75, x 163 w 40
+# Rows: y 10 h 18, y 28 h 41, y 69 h 18, y 87 h 18
+_NOW_WEATHER_TEXT_BOX = ((26, 10), (26 + 62 + 75 + 40, 10 + 18))
+_NOW_ICON_BOX = ((26, 28), (26 + 62, 28 + 41 + 18 + 18))
+_NOW_TEMPERATURE_BOX = ((88, 28), (88 + 75 + 40, 28 + 41))
+_NOW_FEELS_LIKE_LABEL_BOX = ((88, 69), (88 + 75, 69 + 18))
+_NOW_FEELS_LIKE_TEMP_BOX = ((163, 69), (163 + 40, 69 + 18))
+_NOW_HUMIDITY_LABEL_BOX = ((88, 87), (88 + 75, 87 + 18))
+_NOW_HUMIDITY_BOX = ((163, 87), (163 + 40, 87 + 18))
+
+# Top right panel
+# Columns: x 208 w 62, x 270 w 80, x 350 w 80
+# Rows: same as the now panel
+# Precipitation icons are 30 wide with an 8 margin, and are moved up a little
+# because they're lower set than expected and don't look centered
+_TOP_RIGHT_WEATHER_TEXT_WIDTH = 62 + 80 + 80
+_TOP_RIGHT_WEATHER_TEXT_BOX = ((208, 10), (208 + _TOP_RIGHT_WEATHER_TEXT_WIDTH, 10 + 18))
+_TOP_RIGHT_ICON_BOX = ((208, 28), (208 + 62, 28 + 41 + 18 + 18))
+_TOP_RIGHT_HIGH_TEMP_BOX = ((270, 28), (270 + 80, 28 + 41))
+_TOP_RIGHT_LOW_TEMP_BOX = ((350, 28), (350 + 80, 28 + 41))
+_TOP_RIGHT_FEELS_LIKE_TEMP_BOX = ((270, 69), (350 + 80, 69 + 18))
+_TOP_RIGHT_PRECIP_ICON_BOX = ((270 + 8, 87 - 2), (270 + 30 + 8, 87 + 18))
+_TOP_RIGHT_PRECIP_PROBABILITY_BOX = ((270 + 30 + 8, 87), (270 + 80, 87 + 18))
+_TOP_RIGHT_PRECIP_AMOUNT_ICON_BOX = ((350 + 8, 87 - 4), (350 + 30 + 8, 87 + 18))
+_TOP_RIGHT_PRECIP_AMOUNT_BOX = ((350 + 30 + 8, 87), (350 + 80, 87 + 18))
+
+# Hourly (7 columns, 48 wide + 5 gap) and daily (4 columns, 100 wide + 2 gap) panels
+# Left edge of each column, column width and (y, height) of each row
+_HOURLY_XS = range(64, 64 + 7 * (48 + 5), 48 + 5)
+_HOURLY_W = 48
+_HOURLY_ROWS = ((108, 18), (126, 30), (156, 18), (174, 18), (192, 18))
+_HOURLY_BOX = (64, 108, 64 + 7 * (48 + 5) - 5, 192 + 18)
+
+_DAILY_XS = range(26, 26 + 4 * (100 + 2), 100 + 2)
+_DAILY_W = 100
+_DAILY_ROWS = ((216, 18), (234, 18), (252, 30), (282, 18), (300, 18))
+# The description can use 3 rows
+_DAILY_BOX = (26, 216, 26 + 4 * (100 + 2) - 2, 300 + 3 * 18)
+
+@dataclass(slots=True, frozen=True)
+class DashboardConfig():
+    '''
+        The settings in the [dashboard] section of app_config.toml
+        Missing settings use the defaults below
+    '''
+    display_controller: str | None = None
+    weather_provider: str | None = None
+    calendar_provider: str | None = None
+    lat_long: str | None = None
+    unit_type: str = ''
+    quiet_hours: tuple[int, ...] = ()
+    time_zone: str | None = None
+    debug_mode: bool = False
+
+    @classmethod
+    def from_dict(cls, section):
+        ''' Builds the config from the parsed section, ignoring unknown settings '''
+        names = {field.name for field in fields(cls)}
+        settings = {key: val for key, val in section.items() if key in names}
+
+        # TOML arrays are parsed as lists, keep the frozen config hashable
+        if 'quiet_hours' in settings:
+            settings['quiet_hours'] = tuple(settings['quiet_hours'])
+
+        return cls(**settings)
+
+@functools.lru_cache(maxsize=None)
+def _load_font(path, size):
+    '''
+        Returns the FreeType font for path at size
+        Fonts are cached, so each path and size is only loaded once
+    '''
+    return ImageFont.truetype(path, size)
+
+def _load_image(path):
+    '''
+        Returns a fully decoded copy of the image at path, and closes the file
+    '''
+    with Image.open(path) as image:
+        return image.copy()
+
+def _truncate(text, fits):
+    '''
+        Returns text, shortened with an ellipsis if needed, so that fits(text) is True
+        The cut point is found with a binary search, rather than
+        removing a character and measuring again until it fits
+    '''
+    if fits(text):
+        return text
+
+    # The longest prefix that fits is between lo and hi
+    lo = 0
+    hi = max(len(text) - 2, 0)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fits(text[:mid] + '…'):
+            lo = mid
+        else:
+            hi = mid - 1
+
+    return text[:lo] + '…'
+
+def _fmt_ampm(dt):
+    '''
+        Formats a time like the calendar shows it: 9:05 a, 12:30 p
+        Built directly from the hour and minute, rather than formatting with
+        strftime, then trimming and lowercasing the result
+    '''
+    return f'{dt.hour % 12 or 12}:{dt.minute:02d} {"a" if dt.hour < 12 else "p"}'
+
+def _fmt_percent(value):
+    '''
+        Formats a humidity or precipitation probability, '–' if it's unknown
+    '''
+    if value is None:
+        return '–'
+
+    return f'{round(value)}%'
+
+def _wrap_truncated(text, width, max_rows):
+    '''
+        Wraps text into at most max_rows lines of width characters
+        If the text needs more rows, the last row is cut short with an ellipsis
+
+        The text is wrapped once. The rows before the last are kept as they are,
+        and the last row is filled with as much of the remaining text as fits,
+        rather than trimming the text and wrapping it again until it fits
+    '''
+    lines = textwrap.wrap(text, width)
+    if len(lines) <= max_rows:
+        return lines
+
+    kept = [line.rstrip() for line in lines[:max_rows - 1]]
+
+    # Find where the last row starts in the original text. wrap() only changes
+    # whitespace, so count the non-whitespace characters in the kept rows
+    remaining = sum(len(line) - line.count(' ') for line in kept)
+    pos = 0
+    while remaining:
+        if not text[pos].isspace():
+            remaining -= 1
+        pos += 1
+
+    return kept + [text[pos:].lstrip()[:width - 1] + '…']
+
 class Dashboard():
     def __init__(self):
         # Read config file
-        with open('app_config.toml', 'rb') as config_file:
-            self.config = tomllib.load(config_file)
+        self.config = self._load_config()
+        self.cfg = DashboardConfig.from_dict(self.config.get('dashboard', {}))
 
         self.display = None
         self.forecast = None
         self.calendar = None
         self.canvas = None
-
-        self.debug_mode = self.config['dashboard'].get('debug_mode', False)
-        self.quiet_hours = set(self.config['dashboard'].get('quiet_hours', {}))
-        self.time_zone = self.config['dashboard'].get('time_zone')
+        # Digest of the last image pushed to the display, saved with the session
+        self.last_image_digest = None
+        # The last drawing of each cached panel and the key it was drawn from,
+        # saved with the session. See _draw_cached_panel()
+        self.panel_cache = {}
+        self._background = None
+
+        self.debug_mode = self.cfg.debug_mode
+        # Bit n is set when hour n is a quiet hour
+        self._quiet_mask = 0
+        for hour in self.cfg.quiet_hours:
+            self._quiet_mask |= 1 << int(hour)
+        self.time_zone = self.cfg.time_zone
         self.next_refresh = datetime.min
 
         if platform.system() == 'Windows':
@@ -52,10 +227,17 @@ class Dashboard():
             self.hour_ampm = '%-I %p'
             self.hour_minute_ampm = '%-I:%M %p'
 
+        # Hour and weekday labels only depend on the hour or weekday,
+        # so format them once and look them up when drawing
+        self.hour_ampm_strs = [datetime(2000, 1, 1, hour).strftime(self.hour_ampm).lower()
+                                for hour in range(24)]
+        # Jan 3, 2000 was a Monday, matching weekday() == 0
+        self.weekday_strs = [datetime(2000, 1, 3 + day).strftime('%A') for day in range(7)]
+
         # Set unit type
         # Dashboard will store full word, but individual APIs may store a different value
         # based on what the API spec requests
-        config_unit = self.config['dashboard'].get('unit_type', '').casefold()
+        config_unit = self.cfg.unit_type.casefold()
         if config_unit == 'metric':
             self.unit_type = 'metric'
         elif config_unit == 'imperial':
@@ -71,96 +253,171 @@ class Dashboard():
             self._init_forecast()
             self._init_calendar()
 
-        # Create pathlib path to assets
+        # Paths to assets
+        # Resolved once, so the absolute path isn't worked out for every file
+        self._assets = Path('assets/').resolve()
+        self._font_roboto = self._assets / 'fonts/Roboto-Regular.ttf'
+        self._font_roboto_bold = self._assets / 'fonts/Roboto-Bold.ttf'
+        self._font_weather = self._assets / 'fonts/weathericons-regular-webfont.ttf'
+        self._bg_paths = {
+            key: self._assets / f'images/background_{key}.bmp'
+            for key in ('today', 'tomorrow', 'tonight')
+        }
+        self._border_left_path = self._assets / 'images/border_edge_left.bmp'
+        self._border_right_path = self._assets / 'images/border_edge_right.bmp'
+
         # Set up fonts
-        self.assests_path = Path('assets/')
+        roboto = os.fspath(self._font_roboto)
+        roboto_bold = os.fspath(self._font_roboto_bold)
+        weather_icons = os.fspath(self._font_weather)
         self.fonts = {
             'Roboto' : {
-                'Tiny': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/Roboto-Regular.ttf').absolute())
-                            , 10)
-                , 'Small': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/Roboto-Regular.ttf').absolute())
-                            , 16)
-                , 'Medium': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/Roboto-Regular.ttf').absolute())
-                            , 24)
-                , 'Large': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/Roboto-Regular.ttf').absolute())
-                            , 32)
+                'Tiny': _load_font(roboto, 10)
+                , 'Small': _load_font(roboto, 16)
+                , 'Medium': _load_font(roboto, 24)
+                , 'Large': _load_font(roboto, 32)
             }
             , 'RobotoBold' : {
-                'Medium': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/Roboto-Bold.ttf').absolute())
-                            , 24)
-                , 'Large': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/Roboto-Bold.ttf').absolute())
-                            , 32)
+                'Medium': _load_font(roboto_bold, 24)
+                , 'Large': _load_font(roboto_bold, 32)
             }
             , 'Weather': {
-                'Small': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/weathericons-regular-webfont.ttf').absolute())
-                            , 14)
-                , 'Medium': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/weathericons-regular-webfont.ttf').absolute())
-                            , 22)
-                , 'Large': ImageFont.truetype(
-                            str((self.assests_path / 'fonts/weathericons-regular-webfont.ttf').absolute())
-                            , 40)
+                'Small': _load_font(weather_icons, 14)
+                , 'Medium': _load_font(weather_icons, 22)
+                , 'Large': _load_font(weather_icons, 40)
             }
         }
 
+        # Flat references to each font, for drawing
+        self.f_roboto_tiny = self.fonts['Roboto']['Tiny']
+        self.f_roboto_small = self.fonts['Roboto']['Small']
+        self.f_roboto_medium = self.fonts['Roboto']['Medium']
+        self.f_roboto_large = self.fonts['Roboto']['Large']
+        self.f_bold_medium = self.fonts['RobotoBold']['Medium']
+        self.f_bold_large = self.fonts['RobotoBold']['Large']
+        self.f_wx_small = self.fonts['Weather']['Small']
+        self.f_wx_medium = self.fonts['Weather']['Medium']
+        self.f_wx_large = self.fonts['Weather']['Large']
+
+        # Decode the background and border images once
+        self._bg = {key: _load_image(path) for key, path in self._bg_paths.items()}
+
+        # The borders are converted to the backgrounds' mode, so pasting them
+        # onto the image is a straight copy, with no conversion per paste
+        mode = self._bg['today'].mode
+        self._border_left = _load_image(self._border_left_path).convert(mode)
+        self._border_right = _load_image(self._border_right_path).convert(mode)
+
+        # A single image and canvas are drawn on for every refresh
+        # Each refresh starts by pasting the background over the last image
+        self._canvas_img = Image.new(self._bg['today'].mode, self._bg['today'].size)
+        self.canvas = ImageDraw.Draw(self._canvas_img)
+
+    def _load_config(self):
+        '''
+            Returns the parsed app_config.toml
+
+            The parsed config is cached in app_config.pickle, along with the
+            modified time and size of app_config.toml. The TOML is only parsed
+            again when app_config.toml has changed
+        '''
+        log.debug('Entering _load_config()')
+
+        config_path = Path('app_config.toml')
+        cache_path = Path('app_config.pickle')
+
+        config_stat = config_path.stat()
+        header = (config_stat.st_mtime_ns, config_stat.st_size)
+
+        if cache_path.is_file():
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_header, config = pickle.load(f)
+
+                if cached_header == header:
+                    log.debug('Exiting _load_config() with cached config')
+                    return config
+            except Exception:
+                log.exception('Failed to load app_config.pickle.')
+
+        config = tomllib.loads(config_path.read_bytes().decode('utf-8'))
+
+        # Write to a temp file and swap it in, so a partial write is never read
+        temp_path = cache_path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            pickle.dump((header, config), f)
+        os.replace(temp_path, cache_path)
+
+        log.debug('Exiting _load_config()')
+        return config
+
     def _init_display(self):
         # Create display object
         if not self.display:
-            try:
-                if self.config['dashboard']['display_controller'].casefold() == 'waveshare_epaper':
-                    self.display = display_controller.Waveshare_ePaper(
-                        model= self.config['waveshare_epaper']['model']
-                        , debug_mode= self.debug_mode
-                    )
-                else:
-                    raise NotImplementedError('Display Controller not supported.')
-            except:
+            display_controller_name = self.cfg.display_controller
+            if not display_controller_name:
                 raise AttributeError('Display Controller not specified.')
 
+            if display_controller_name.casefold() == 'waveshare_epaper':
+                try:
+                    model = self.config['waveshare_epaper']['model']
+                except KeyError:
+                    raise AttributeError('Display Controller is missing properties.')
+
+                self.display = display_controller.Waveshare_ePaper(
+                    model= model
+                    , debug_mode= self.debug_mode
+                )
+            else:
+                raise NotImplementedError('Display Controller not supported.')
+
     def _init_forecast(self):
         if not self.forecast:
+            weather_provider = self.cfg.weather_provider
+            if not weather_provider:
+                raise AttributeError('Weather Provider not specified.')
+            if not self.cfg.lat_long:
+                raise AttributeError('Weather Provider is missing properties.')
+
+            # Only a missing config value is reported as missing properties,
+            # anything else raised while creating the object is a real error
             try:
-                weather_provider = self.config['dashboard']['weather_provider'].casefold()
+                weather_provider = weather_provider.casefold()
                 if weather_provider == 'accuweather':
                     # Create AccuWeather object
                     self.forecast = forecast_api.AccuWeather(
                         api_key= self.config['accuweather']['api_key']
                         , unit_type= self.unit_type
-                        , lat_long= self.config['dashboard']['lat_long']
+                        , lat_long= self.cfg.lat_long
                         , time_zone = self.time_zone
                         , nws_user_agent= self.config['nws']['user_agent']
+                        , details= self.config['accuweather'].get('details', True)
                     )
                 elif weather_provider == 'openweather':
                     # Create OpenWeather weather object
                     self.forecast = forecast_api.OpenWeather(
                         api_key= self.config['openweather']['api_key']
                         , unit_type= self.unit_type
-                        , lat_long= self.config['dashboard']['lat_long']
+                        , lat_long= self.cfg.lat_long
                         , time_zone = self.time_zone
                         , lang= self.config['openweather']['language']
                     )
                 else:
                     raise NotImplementedError('Weather Provider not supported.')
-            except:
-                raise AttributeError('Weather Provider not specified or is missing properties.')
+            except KeyError:
+                raise AttributeError('Weather Provider is missing properties.')
 
     def _init_calendar(self):
         if not self.calendar:
-            try:
-                if self.config['dashboard']['calendar_provider'].casefold() == 'google':
-                    self.calendar = calendar_api.GoogleCalendar(self.time_zone)
-                else:
-                    raise NotImplementedError('Calendar Provider not supported.')
-            except:
+            calendar_provider = self.cfg.calendar_provider
+            if not calendar_provider:
                 raise AttributeError('Calendar Provider not specified.')
 
+            if calendar_provider.casefold() == 'google':
+                self.calendar = calendar_api.GoogleCalendar(self.time_zone)
+            else:
+                raise NotImplementedError('Calendar Provider not supported.')
+
     def _restore_session(self):
         '''
             Attempts to restore session state from pickle file
@@ -187,14 +444,23 @@ class Dashboard():
             if config_mdate < pickle_mdate:
                 log.info('app_config has not been modified recently. Opening pickle file and restoring data.')
 
-                with open(pickle_path, 'rb') as f:
-                    data = pickle.load(f)
+                try:
+                    with open(pickle_path, 'rb') as f:
+                        data = pickle.load(f)
+                except Exception:
+                    log.exception('Failed to load dashboard.pickle.')
+                    data = None
 
-                    self.display = data[0]
-                    self.forecast = data[1]
-                    self.calendar = data[2]
+                if data and data[0] == SESSION_VERSION:
+                    self.display = data[1]
+                    self.forecast = data[2]
+                    self.calendar = data[3]
+                    self.last_image_digest = data[4]
+                    self.panel_cache = data[5]
 
                     success = True
+                else:
+                    log.info('dashboard.pickle was saved by a different version. Ignoring dashboard.pickle.')
             else:
                 log.info('app_config has been updated since last run. Ignoring dashboard.pickle.')
         else:
@@ -211,7 +477,8 @@ class Dashboard():
 
         pickle_path = Path('dashboard.pickle')
 
-        data = [self.display, self.forecast, self.calendar]
+        data = [SESSION_VERSION, self.display, self.forecast, self.calendar
+                , self.last_image_digest, self.panel_cache]
         with open(pickle_path, 'wb') as f:
             log.debug('Dumping dashboard into pickle file')
             pickle.dump(data, f)
@@ -221,23 +488,34 @@ class Dashboard():
     def run(self):
         log.debug('Entering run()')
 
+        # Use the same time throughout the run, so a run that straddles
+        # the hour is handled consistently
+        now = datetime.now()
+
         try:
             # Check to see if the current hour is a quiet hour
-            if datetime.now().hour in self.quiet_hours:
-                log.info(f'The current hour ({datetime.now().hour}:00) is a quiet hour. Sleeping for an hour.')
+            if (self._quiet_mask >> now.hour) & 1:
+                log.info(f'The current hour ({now.hour}:00) is a quiet hour. Sleeping for an hour.')
 
                 # If next_refresh is initial value,
                 # set it to the current time
                 if self.next_refresh == datetime.min:
-                    self.next_refresh = datetime.now()
+                    self.next_refresh = now
 
                 self.next_refresh += timedelta(hours= 1)
             else:
                 # Invoke refresh method, store result to push screen refresh if needed
-                screen_update_needed_forecast = self.forecast.refresh()
-                log.debug(f'Calendar refresh exited with status: {screen_update_needed_forecast}')
-                screen_update_needed_calendar = self.calendar.refresh()
-                log.debug(f'Calendar refresh exited with status: {screen_update_needed_calendar}')
+                # The forecast and calendar are separate services, so refresh them
+                # at the same time rather than waiting on one before the other
+                # result() re-raises any exception from the refresh
+                with ThreadPoolExecutor(max_workers= 2) as executor:
+                    forecast_future = executor.submit(self.forecast.refresh)
+                    calendar_future = executor.submit(self.calendar.refresh)
+
+                    screen_update_needed_forecast = forecast_future.result()
+                    log.debug(f'Forecast refresh exited with status: {screen_update_needed_forecast}')
+                    screen_update_needed_calendar = calendar_future.result()
+                    log.debug(f'Calendar refresh exited with status: {screen_update_needed_calendar}')
 
                 screen_update_needed = screen_update_needed_forecast or screen_update_needed_calendar
 
@@ -245,42 +523,57 @@ class Dashboard():
                 self.next_refresh = self.forecast.get_next_refresh()
                 log.debug(f'Next refresh: {self.next_refresh}')
 
-                if self.forecast.api_calls_remaining < 1:
+                # The forecasts keep their last values, but alerts are still
+                # refreshed, so a screen update is still drawn if they changed
+                if not self.forecast.can_call():
                     log.critical(f'All forecast API calls have been exhausted.')
-                    screen_update_needed = False
 
                 if screen_update_needed:
                     daily_forecasts = self.forecast.get_daytime_forecasts()
 
-                    # Initialize image and canvas
+                    # Reset the image to the background
                     # If it's after 6 pm, display tonight or tomorrow,
                     # depending on service's offerings
-                    if datetime.now().hour >= 18:
+                    if now.hour >= 18:
                         if self.forecast.has_nighttime_forecasts:
-                            img = Image.open(str((self.assests_path / 'images/background_tonight.bmp').absolute()))
+                            background = 'tonight'
                             top_right_panel_forecast = self.forecast.get_nighttime_forecasts()[0]
                             daily_forecasts = daily_forecasts[1:]
                         else:
-                            img = Image.open(str((self.assests_path / 'images/background_tomorrow.bmp').absolute()))
+                            background = 'tomorrow'
                             top_right_panel_forecast = daily_forecasts[1]
                             daily_forecasts = daily_forecasts[2:]
                     else:
-                        img = Image.open(str((self.assests_path / 'images/background_today.bmp').absolute()))
+                        background = 'today'
                         top_right_panel_forecast = daily_forecasts[0]
                         daily_forecasts = daily_forecasts[1:]
-                    self.canvas = ImageDraw.Draw(img)
+
+                    self._background = background
+                    img = self._canvas_img
+                    img.paste(self._bg[background], (0, 0))
 
                     self.draw_now_panel()
                     self.draw_top_right_panel(top_right_panel_forecast)
                     self.draw_hourly_panel()
                     self.draw_daily_panel(daily_forecasts)
-                    self.draw_footer()
+                    self.draw_footer(now)
                     self.draw_alerts(img)
                     self.draw_upcoming_events()
 
-                    log.info('Pushing image to dashboard.bmp')
-                    img.save('dashboard.bmp')
-                    self.display.display_image(img)
+                    # dashboard.bmp is only needed to check the output in debug mode
+                    # Write to a temp file and swap it in, so a partial image is never read
+                    if self.debug_mode:
+                        log.info('Pushing image to dashboard.bmp')
+                        img.save('dashboard.bmp.tmp', format= 'BMP')
+                        os.replace('dashboard.bmp.tmp', 'dashboard.bmp')
+
+                    # Pushing to the display is slow, skip it if the image hasn't changed
+                    digest = hashlib.blake2b(img.tobytes(), digest_size= 16).digest()
+                    if digest == self.last_image_digest:
+                        log.info('Image is unchanged, display will not be updated')
+                    else:
+                        self.display.display_image(img)
+                        self.last_image_digest = digest
                 else:
                     log.info('Screen update not needed')
 
@@ -296,117 +589,43 @@ class Dashboard():
     def draw_now_panel(self):
         log.debug('Entering draw_now_panel()')
 
-        # Alignment aliases
-        TOP = dh.VerticalAlignment.TOP
-        MIDDLE = dh.VerticalAlignment.MIDDLE
-        BOTTOM = dh.VerticalAlignment.BOTTOM
-
-        LEFT = dh.HorizontalAlignment.LEFT
-        CENTER = dh.HorizontalAlignment.CENTER
-        RIGHT = dh.HorizontalAlignment.RIGHT
-
-        # Grid definition
-        col_1_x = 26
-        col_1_w = 62
-        col_2_x = 88
-        col_2_w = 75
-        col_3_x = 163
-        col_3_w = 40
-
-        row_1_y = 10
-        row_1_h = 18
-        row_2_y = 28
-        row_2_h = 41
-        row_3_y = 69
-        row_3_h = 18
-        row_4_y = 87
-        row_4_h = 18
-
         current_forecast = self.forecast.current_conditions.forecasts[0]
 
         # Strings
         temperature_str = current_forecast.current_temperature.display()
         feels_like_temp_str = current_forecast.feels_like_temperature.display()
-        humidity_str = f'{str(round(current_forecast.relative_humidity))}%'
+        humidity_str = _fmt_percent(current_forecast.relative_humidity)
 
         # Text objects
-        weather_text = dh.Text(self.canvas, current_forecast.weather_text, self.fonts['Roboto']['Small'])
-        icon = dh.Text(self.canvas, current_forecast.weather_icon, self.fonts['Weather']['Large'])
-        temperature = dh.Text(self.canvas, temperature_str, self.fonts['RobotoBold']['Large'])
-        feels_like_label = dh.Text(self.canvas, 'Feels Like:', self.fonts['Roboto']['Small'])
-        feels_like_temp = dh.Text(self.canvas, feels_like_temp_str, self.fonts['Roboto']['Small'])
-        humidity_label = dh.Text(self.canvas, 'Humidity:', self.fonts['Roboto']['Small'])
-        humidity = dh.Text(self.canvas, humidity_str, self.fonts['Roboto']['Small'])
-
-        # Coordinates
-        weather_text_start = (col_1_x, row_1_y)
-        weather_text_end = (col_1_x + col_1_w + col_2_w + col_3_w, row_1_y + row_1_h)
-
-        icon_start = (col_1_x, row_2_y)
-        icon_end = (col_1_x + col_1_w, row_2_y + row_2_h + row_3_h + row_4_h)
-
-        temperature_start = (col_2_x, row_2_y)
-        temperature_end = (col_2_x + col_2_w + col_3_w, row_2_y + row_2_h)
-
-        feels_like_label_start = (col_2_x, row_3_y)
-        feels_like_label_end = (col_2_x + col_2_w, row_3_y + row_3_h)
-
-        feels_like_temp_start = (col_3_x, row_3_y)
-        feels_like_temp_end = (col_3_x + col_3_w, row_3_y + row_3_h)
-
-        humidity_label_start = (col_2_x, row_4_y)
-        humidity_label_end = (col_2_x + col_2_w, row_4_y + row_4_h)
-
-        humidity_start = (col_3_x, row_4_y)
-        humidity_end = (col_3_x + col_3_w, row_4_y + row_4_h)
+        weather_text = dh.Text(self.canvas, current_forecast.weather_text, self.f_roboto_small)
+        icon = dh.Text(self.canvas, current_forecast.weather_icon, self.f_wx_large)
+        temperature = dh.Text(self.canvas, temperature_str, self.f_bold_large)
+        feels_like_label = dh.Text(self.canvas, 'Feels Like:', self.f_roboto_small)
+        feels_like_temp = dh.Text(self.canvas, feels_like_temp_str, self.f_roboto_small)
+        humidity_label = dh.Text(self.canvas, 'Humidity:', self.f_roboto_small)
+        humidity = dh.Text(self.canvas, humidity_str, self.f_roboto_small)
 
         # Write
-        weather_text.write(weather_text_start, weather_text_end, LEFT, MIDDLE)
-        icon.write(icon_start, icon_end, CENTER, MIDDLE)
-        temperature.write(temperature_start, temperature_end, CENTER, MIDDLE)
-        feels_like_label.write(feels_like_label_start, feels_like_label_end, LEFT, MIDDLE)
-        feels_like_temp.write(feels_like_temp_start, feels_like_temp_end, LEFT, MIDDLE)
-        humidity_label.write(humidity_label_start, humidity_label_end, LEFT, MIDDLE)
-        humidity.write(humidity_start, humidity_end, LEFT, MIDDLE)
+        weather_text.write(*_NOW_WEATHER_TEXT_BOX, _LEFT, _MIDDLE)
+        icon.write(*_NOW_ICON_BOX, _CENTER, _MIDDLE)
+        temperature.write(*_NOW_TEMPERATURE_BOX, _CENTER, _MIDDLE)
+        feels_like_label.write(*_NOW_FEELS_LIKE_LABEL_BOX, _LEFT, _MIDDLE)
+        feels_like_temp.write(*_NOW_FEELS_LIKE_TEMP_BOX, _LEFT, _MIDDLE)
+        humidity_label.write(*_NOW_HUMIDITY_LABEL_BOX, _LEFT, _MIDDLE)
+        humidity.write(*_NOW_HUMIDITY_BOX, _LEFT, _MIDDLE)
 
         log.debug('Exiting draw_now_panel()')
 
     def draw_top_right_panel(self, top_right_forecast):
         log.debug('Entering draw_top_right_panel()')
 
-        # Alignment aliases
-        TOP = dh.VerticalAlignment.TOP
-        MIDDLE = dh.VerticalAlignment.MIDDLE
-        BOTTOM = dh.VerticalAlignment.BOTTOM
-
-        LEFT = dh.HorizontalAlignment.LEFT
-        CENTER = dh.HorizontalAlignment.CENTER
-        RIGHT = dh.HorizontalAlignment.RIGHT
-
-        # Grid definition
-        col_1_x = 208
-        col_1_w = 62
-        col_2_x = 270
-        col_2_w = 80
-        col_3_x = 350
-        col_3_w = 80
-
-        row_1_y = 10
-        row_1_h = 18
-        row_2_y = 28
-        row_2_h = 41
-        row_3_y = 69
-        row_3_h = 18
-        row_4_y = 87
-        row_4_h = 18
-
         # Strings
         high_temp_str = top_right_forecast.high_temperature.display()
         low_temp_str = top_right_forecast.low_temperature.display()
         feels_like_high_str = top_right_forecast.feels_like_high.display()
         feels_like_low_str = top_right_forecast.feels_like_low.display()
         feels_like_str = f'Feels Like: {feels_like_high_str} / {feels_like_low_str}'
-        precip_probability_str = f'{round(top_right_forecast.precipitation_probability)}%'
+        precip_probability_str = _fmt_percent(top_right_forecast.precipitation_probability)
         if top_right_forecast.precipitation_amount is None:
             precip_amount_str = '–'
         else:
@@ -414,141 +633,91 @@ class Dashboard():
 
         # Text objects
         # Ensure weather text isn't too long for cell
-        weather_text_cell_width = col_1_w + col_2_w + col_3_w
-        weather_text_str = top_right_forecast.weather_text
-        while True:
-            weather_text = dh.Text(self.canvas, weather_text_str, self.fonts['Roboto']['Small'])
-            # If it fits, break the loop
-            if weather_text.width <= weather_text_cell_width:
-                break
-
-            # Otherwise, remove another character and try again
-            weather_text_str = weather_text_str[:-2] + '…'
-
-        icon = dh.Text(self.canvas, top_right_forecast.weather_icon, self.fonts['Weather']['Large'])
-        high_temp = dh.Text(self.canvas, high_temp_str, self.fonts['RobotoBold']['Large'])
-        low_temp = dh.Text(self.canvas, f' / {low_temp_str}', self.fonts['Roboto']['Medium'])
-        feels_like_temp = dh.Text(self.canvas, feels_like_str, self.fonts['Roboto']['Small'])
-        precip_icon = dh.Text(self.canvas, str(top_right_forecast.precipitation_icon), self.fonts['Weather']['Small'])
-        precip_probability = dh.Text(self.canvas, precip_probability_str, self.fonts['Roboto']['Small'])
-        precip_amount_icon = dh.Text(self.canvas, '\uf04e', self.fonts['Weather']['Medium'])
-        precip_amount = dh.Text(self.canvas, precip_amount_str, self.fonts['Roboto']['Small'])
-
-        # Coordinates
-        weather_text_start = (col_1_x, row_1_y)
-        weather_text_end = (col_1_x + weather_text_cell_width, row_1_y + row_1_h)
-
-        icon_start = (col_1_x, row_2_y)
-        icon_end = (col_1_x + col_1_w, row_2_y + row_2_h + row_3_h + row_4_h)
-
-        high_temp_start = (col_2_x, row_2_y)
-        high_temp_end = (col_2_x + col_2_w, row_2_y + row_2_h)
-
-        low_temp_start = (col_3_x, row_2_y)
-        low_temp_end = (col_3_x + col_3_w, row_2_y + row_2_h)
-
-        feels_like_temp_start = (col_2_x, row_3_y)
-        feels_like_temp_end = (col_3_x + col_3_w, row_3_y + row_3_h)
-
-        left_margin = 8
-        icon_width = 30
-
-        # Icon is lower set than expected and doesn't look centered. Move y up a little.
-        precip_icon_start = (col_2_x + left_margin, row_4_y - 2)
-        precip_icon_end = (col_2_x + icon_width + left_margin, row_4_y + row_4_h)
-
-        precip_probability_start = (col_2_x + icon_width + left_margin, row_4_y)
-        precip_probability_end = (col_2_x + col_2_w, row_4_y + row_4_h)
-
-        # Icon is lower set than expected and doesn't look centered. Move y up a little.
-        precip_amount_icon_start = (col_3_x + left_margin, row_4_y - 4)
-        precip_amount_icon_end = (col_3_x + icon_width + left_margin, row_4_y + row_4_h)
-
-        precip_amount_start = (col_3_x + icon_width + left_margin, row_4_y)
-        precip_amount_end = (col_3_x + col_3_w, row_4_y + row_4_h)
+        font = self.f_roboto_small
+        weather_text_str = _truncate(top_right_forecast.weather_text
+                                , lambda s: font.getlength(s) <= _TOP_RIGHT_WEATHER_TEXT_WIDTH)
+        weather_text = dh.Text(self.canvas, weather_text_str, font)
+
+        icon = dh.Text(self.canvas, top_right_forecast.weather_icon, self.f_wx_large)
+        high_temp = dh.Text(self.canvas, high_temp_str, self.f_bold_large)
+        low_temp = dh.Text(self.canvas, f' / {low_temp_str}', self.f_roboto_medium)
+        feels_like_temp = dh.Text(self.canvas, feels_like_str, self.f_roboto_small)
+        precip_icon = dh.Text(self.canvas, str(top_right_forecast.precipitation_icon), self.f_wx_small)
+        precip_probability = dh.Text(self.canvas, precip_probability_str, self.f_roboto_small)
+        precip_amount_icon = dh.Text(self.canvas, '\uf04e', self.f_wx_medium)
+        precip_amount = dh.Text(self.canvas, precip_amount_str, self.f_roboto_small)
 
         # Write
-        weather_text.write(weather_text_start, weather_text_end, LEFT, MIDDLE)
-        icon.write(icon_start, icon_end, CENTER, MIDDLE)
-        high_temp.write(high_temp_start, high_temp_end, RIGHT, MIDDLE)
-        low_temp.write(low_temp_start, low_temp_end, LEFT, MIDDLE)
-        feels_like_temp.write(feels_like_temp_start, feels_like_temp_end, LEFT, MIDDLE)
+        weather_text.write(*_TOP_RIGHT_WEATHER_TEXT_BOX, _LEFT, _MIDDLE)
+        icon.write(*_TOP_RIGHT_ICON_BOX, _CENTER, _MIDDLE)
+        high_temp.write(*_TOP_RIGHT_HIGH_TEMP_BOX, _RIGHT, _MIDDLE)
+        low_temp.write(*_TOP_RIGHT_LOW_TEMP_BOX, _LEFT, _MIDDLE)
+        feels_like_temp.write(*_TOP_RIGHT_FEELS_LIKE_TEMP_BOX, _LEFT, _MIDDLE)
 
-        precip_icon.write(precip_icon_start, precip_icon_end, CENTER, TOP)
-        precip_probability.write(precip_probability_start, precip_probability_end, LEFT, MIDDLE)
+        precip_icon.write(*_TOP_RIGHT_PRECIP_ICON_BOX, _CENTER, _TOP)
+        precip_probability.write(*_TOP_RIGHT_PRECIP_PROBABILITY_BOX, _LEFT, _MIDDLE)
 
-        precip_amount_icon.write(precip_amount_icon_start, precip_amount_icon_end, CENTER, TOP)
-        precip_amount.write(precip_amount_start, precip_amount_end, LEFT, MIDDLE)
+        precip_amount_icon.write(*_TOP_RIGHT_PRECIP_AMOUNT_ICON_BOX, _CENTER, _TOP)
+        precip_amount.write(*_TOP_RIGHT_PRECIP_AMOUNT_BOX, _LEFT, _MIDDLE)
 
         log.debug('Exiting draw_top_right_panel()')
 
+    def _draw_cached_panel(self, name, box, key, draw):
+        '''
+            Calls draw() to draw a panel, unless the panel was last drawn
+            from the same key on the same background. Then the panel
+            saved from the last drawing is pasted instead
+
+            Parameters:
+                name: The name of the panel in panel_cache
+                box: The (left, top, right, bottom) of the panel
+                key: The values the panel is drawn from
+                draw: Function that draws the panel
+        '''
+        key = (self._background, key)
+
+        cached = self.panel_cache.get(name)
+        if cached and cached[0] == key:
+            log.debug(f'{name} panel is unchanged, pasting the last drawing')
+            self._canvas_img.paste(cached[1], box[:2])
+        else:
+            draw()
+            self.panel_cache[name] = (key, self._canvas_img.crop(box))
+
     def draw_hourly_panel(self):
         log.debug('Entering draw_hourly_panel()')
 
-        # Alignment aliases
-        TOP = dh.VerticalAlignment.TOP
-        MIDDLE = dh.VerticalAlignment.MIDDLE
-        BOTTOM = dh.VerticalAlignment.BOTTOM
+        ((row_1_y, row_1_h), (row_2_y, row_2_h), (row_3_y, row_3_h)
+            , (row_4_y, row_4_h), (row_5_y, row_5_h)) = _HOURLY_ROWS
+        w = _HOURLY_W
 
-        LEFT = dh.HorizontalAlignment.LEFT
-        CENTER = dh.HorizontalAlignment.CENTER
-        RIGHT = dh.HorizontalAlignment.RIGHT
+        font_small = self.f_roboto_small
+        font_icon = self.f_wx_medium
 
-        row_1_y = 108
-        row_1_h = 18
-        row_2_y = 126
-        row_2_h = 30
-        row_3_y = 156
-        row_3_h = 18
-        row_4_y = 174
-        row_4_h = 18
-        row_5_y = 192
-        row_5_h = 18
+        # Strings for each column, which are also the panel's cache key
+        columns = []
+        for x, item in zip(_HOURLY_XS, self.forecast.hourly_forecasts.forecasts):
+            hour_str = self.hour_ampm_strs[item.forecast_datetime.hour]
 
-        x = 64
-        w = 48
-
-        i = 0
-        items_to_show = 7
+            temperature_str = item.current_temperature.display()
+            feels_like_str = item.feels_like_temperature.display()
+            precip_probability_str = _fmt_percent(item.precipitation_probability)
 
-        while i < items_to_show:
-            item = self.forecast.hourly_forecasts.forecasts[i]
+            columns.append((x, hour_str, item.weather_icon, temperature_str
+                            , feels_like_str, precip_probability_str))
 
-            # Strings
-            hour_str = item.forecast_datetime.strftime(self.hour_ampm).lower()
+        def draw():
+            for x, hour_str, icon_str, temperature_str, feels_like_str, precip_probability_str in columns:
+                # Write, each row is centered in its cell
+                dh.draw_column(self.canvas, x, w, (
+                    (row_1_y, row_1_h, hour_str, font_small)
+                    , (row_2_y, row_2_h, icon_str, font_icon)
+                    , (row_3_y, row_3_h, temperature_str, font_small)
+                    , (row_4_y, row_4_h, feels_like_str, font_small)
+                    , (row_5_y, row_5_h, precip_probability_str, font_small)
+                ))
 
-            temperature_str = item.current_temperature.display()
-            feels_like_str = item.feels_like_temperature.display()
-            precip_probability_str = f'{round(item.precipitation_probability)}%'
-
-            # Text objects
-            hour = dh.Text(self.canvas, hour_str, self.fonts['Roboto']['Small'])
-            icon = dh.Text(self.canvas, item.weather_icon, self.fonts['Weather']['Medium'])
-            temperature = dh.Text(self.canvas, temperature_str, self.fonts['Roboto']['Small'])
-            feels_like = dh.Text(self.canvas, feels_like_str, self.fonts['Roboto']['Small'])
-            precip_probability = dh.Text(self.canvas, precip_probability_str, self.fonts['Roboto']['Small'])
-
-            # Coordinates
-            hour_start = (x, row_1_y)
-            hour_end = (x + w, row_1_y + row_1_h)
-            icon_start = (x, row_2_y)
-            icon_end = (x + w, row_2_y + row_2_h)
-            temperature_start = (x, row_3_y)
-            temperature_end = (x + w, row_3_y + row_3_h)
-            feels_like_start = (x, row_4_y)
-            feels_like_end = (x + w, row_4_y + row_4_h)
-            precip_probability_start = (x, row_5_y)
-            precip_probability_end = (x + w, row_5_y + row_5_h)
-
-            # Write
-            hour.write(hour_start, hour_end, CENTER, MIDDLE)
-            icon.write(icon_start, icon_end, CENTER, MIDDLE)
-            temperature.write(temperature_start, temperature_end, CENTER, MIDDLE)
-            feels_like.write(feels_like_start, feels_like_end, CENTER, MIDDLE)
-            precip_probability.write(precip_probability_start, precip_probability_end, CENTER, MIDDLE)
-
-            x += w + 5
-            i += 1
+        self._draw_cached_panel('hourly', _HOURLY_BOX, tuple(columns), draw)
 
         log.debug('Exiting draw_hourly_panel()')
 
@@ -558,105 +727,74 @@ class Dashboard():
         DAILY_DESCRIP_MAX_CHARS = 13
         DAILY_DESCRIP_MAX_ROWS = 3
 
-        # Alignment aliases
-        TOP = dh.VerticalAlignment.TOP
-        MIDDLE = dh.VerticalAlignment.MIDDLE
-        BOTTOM = dh.VerticalAlignment.BOTTOM
-
-        LEFT = dh.HorizontalAlignment.LEFT
-        CENTER = dh.HorizontalAlignment.CENTER
-        RIGHT = dh.HorizontalAlignment.RIGHT
-
-        row_1_y = 216
-        row_1_h = 18
-        row_2_y = 234
-        row_2_h = 18
-        row_3_y = 252
-        row_3_h = 30
-        row_4_y = 282
-        row_4_h = 18
-        row_5_y = 300
-        row_5_h = 18
-
-        x = 26
-        w = 100
-
-        i = 0
-        items_to_show = min(4, len(daily_forecasts))
-
-        # TODO: Enumerate properly
-        while i < items_to_show:
-            item = daily_forecasts[i]
-
-            # Strings
-            day_of_week_str = item.forecast_datetime.strftime('%A')
+        ((row_1_y, row_1_h), (row_2_y, row_2_h), (row_3_y, row_3_h)
+            , (row_4_y, row_4_h), (row_5_y, row_5_h)) = _DAILY_ROWS
+        w = _DAILY_W
+
+        font_small = self.f_roboto_small
+        font_icon = self.f_wx_medium
+
+        # Strings for each column, which are also the panel's cache key
+        columns = []
+        for x, item in zip(_DAILY_XS, daily_forecasts):
+            day_of_week_str = self.weekday_strs[item.forecast_datetime.weekday()]
             date_str = item.forecast_datetime.strftime(self.month_day)
 
             high_temperature_str = item.high_temperature.display()
             low_temperature_str = item.low_temperature.display()
             temperature_str = f'{high_temperature_str} / {low_temperature_str}'
 
-            precip_probability_str = f'{round(item.precipitation_probability)}%'
-
-            # Text objects
-            day_of_week = dh.Text(self.canvas, day_of_week_str, self.fonts['Roboto']['Small'])
-            date = dh.Text(self.canvas, date_str, self.fonts['Roboto']['Small'])
-            icon = dh.Text(self.canvas, item.weather_icon, self.fonts['Weather']['Medium'])
-            temperature = dh.Text(self.canvas, temperature_str, self.fonts['Roboto']['Small'])
-            # weather_text = dh.Text(self.canvas, weather_text_str, self.fonts['Roboto']['Small'])
-
-            # Coordinates
-            day_of_week_start = (x, row_1_y)
-            day_of_week_end = (x + w, row_1_y + row_1_h)
-            date_start = (x, row_2_y)
-            date_end = (x + w, row_2_y + row_2_h)
-            icon_start = (x, row_3_y)
-            icon_end = (x + w, row_3_y + row_3_h)
-            temperature_start = (x, row_4_y)
-            temperature_end = (x + w, row_4_y + row_4_h)
-            weather_text_start = (x, row_5_y)
-            weather_text_end = (x + w, row_5_y + row_5_h)
-
-            # Write
-            day_of_week.write(day_of_week_start, day_of_week_end, CENTER, MIDDLE)
-            date.write(date_start, date_end, CENTER, MIDDLE)
-            icon.write(icon_start, icon_end, CENTER, MIDDLE)
-            temperature.write(temperature_start, temperature_end, CENTER, MIDDLE)
-            # weather_text.write(weather_text_start, weather_text_end, CENTER, MIDDLE)
-
             # Ensure text doesn't span more than 3 lines
-            weather_text_str = item.weather_text
-            while len(textwrap.wrap(weather_text_str, DAILY_DESCRIP_MAX_CHARS)) > DAILY_DESCRIP_MAX_ROWS:
-                weather_text_str = weather_text_str[:-2] + '…'
-
-            y = row_5_y
-            for line in textwrap.wrap(weather_text_str, DAILY_DESCRIP_MAX_CHARS):
-                text = dh.Text(self.canvas, line, self.fonts['Roboto']['Small'])
-                text.write((x, y), (x + w, y + row_5_h), CENTER, MIDDLE)
-                y += row_5_h
-
-            x += w + 2
-            i += 1
+            weather_text_str = _truncate(item.weather_text
+                                , lambda s: len(textwrap.wrap(s, DAILY_DESCRIP_MAX_CHARS)) <= DAILY_DESCRIP_MAX_ROWS)
+            weather_text_lines = tuple(textwrap.wrap(weather_text_str, DAILY_DESCRIP_MAX_CHARS))
+
+            columns.append((x, day_of_week_str, date_str, item.weather_icon
+                            , temperature_str, weather_text_lines))
+
+        def draw():
+            for x, day_of_week_str, date_str, icon_str, temperature_str, weather_text_lines in columns:
+                # Text objects
+                day_of_week = dh.Text(self.canvas, day_of_week_str, font_small)
+                date = dh.Text(self.canvas, date_str, font_small)
+                icon = dh.Text(self.canvas, icon_str, font_icon)
+                temperature = dh.Text(self.canvas, temperature_str, font_small)
+
+                # Coordinates
+                day_of_week_start = (x, row_1_y)
+                day_of_week_end = (x + w, row_1_y + row_1_h)
+                date_start = (x, row_2_y)
+                date_end = (x + w, row_2_y + row_2_h)
+                icon_start = (x, row_3_y)
+                icon_end = (x + w, row_3_y + row_3_h)
+                temperature_start = (x, row_4_y)
+                temperature_end = (x + w, row_4_y + row_4_h)
+
+                # Write
+                day_of_week.write(day_of_week_start, day_of_week_end, _CENTER, _MIDDLE)
+                date.write(date_start, date_end, _CENTER, _MIDDLE)
+                icon.write(icon_start, icon_end, _CENTER, _MIDDLE)
+                temperature.write(temperature_start, temperature_end, _CENTER, _MIDDLE)
+
+                y = row_5_y
+                for line in weather_text_lines:
+                    text = dh.Text(self.canvas, line, font_small)
+                    text.write((x, y), (x + w, y + row_5_h), _CENTER, _MIDDLE)
+                    y += row_5_h
+
+        self._draw_cached_panel('daily', _DAILY_BOX, tuple(columns), draw)
 
         log.debug('Exiting draw_daily_panel()')
 
-    def draw_footer(self):
+    def draw_footer(self, now):
         log.debug('Entering draw_footer()')
 
-        # Alignment aliases
-        TOP = dh.VerticalAlignment.TOP
-        MIDDLE = dh.VerticalAlignment.MIDDLE
-        BOTTOM = dh.VerticalAlignment.BOTTOM
-
-        LEFT = dh.HorizontalAlignment.LEFT
-        CENTER = dh.HorizontalAlignment.CENTER
-        RIGHT = dh.HorizontalAlignment.RIGHT
-
         # Text objects
-        last_update_str = (datetime.now().strftime(f'{self.month_day} at ')
-                        + datetime.now().strftime(self.hour_minute_ampm).lower())
-        last_update = dh.Text(self.canvas, f'Last updated on {last_update_str}', self.fonts['Roboto']['Tiny'])
-        powered_by = dh.Text(self.canvas, f'Powered by {self.forecast.weather_service}', self.fonts['Roboto']['Tiny'])
+        # Format the date and time together, then lower case the am/pm at the end
+        last_update_str = now.strftime(f'{self.month_day} at {self.hour_minute_ampm}')
+        last_update_str = last_update_str[:-2] + last_update_str[-2:].lower()
+        last_update = dh.Text(self.canvas, f'Last updated on {last_update_str}', self.f_roboto_tiny)
+        powered_by = dh.Text(self.canvas, f'Powered by {self.forecast.weather_service}', self.f_roboto_tiny)
 
         # Coordinates
         last_update_start = (10, self.display.height - 15)
@@ -666,8 +804,8 @@ class Dashboard():
         powered_by_end = (self.display.width - 10, self.display.height - 15)
 
         # Write
-        last_update.write(last_update_start, last_update_end, LEFT, MIDDLE)
-        powered_by.write(powered_by_start, powered_by_end, RIGHT, MIDDLE)
+        last_update.write(last_update_start, last_update_end, _LEFT, _MIDDLE)
+        powered_by.write(powered_by_start, powered_by_end, _RIGHT, _MIDDLE)
 
         log.debug('Exiting draw_footer()')
 
@@ -681,15 +819,6 @@ class Dashboard():
 
         ALLOW_ALERTS_TO_OVERLAP = True
 
-        # Alignment aliases
-        TOP = dh.VerticalAlignment.TOP
-        MIDDLE = dh.VerticalAlignment.MIDDLE
-        BOTTOM = dh.VerticalAlignment.BOTTOM
-
-        LEFT = dh.HorizontalAlignment.LEFT
-        CENTER = dh.HorizontalAlignment.CENTER
-        RIGHT = dh.HorizontalAlignment.RIGHT
-
         if ALLOW_ALERTS_TO_OVERLAP:
             max_alert_width = self.display.width - 20
         else:
@@ -707,29 +836,31 @@ class Dashboard():
             preposition = 'until'
             time = alert.effective_end
 
-        # Adjust alert text until it fits in allocated space
-        alert_text = alert.title
-        while True:
-            alert_str = f"{alert_text} {preposition} {time.strftime(self.month_day)} {time.strftime(self.hour_minute_ampm).lower()}"
-            alert = dh.Text(self.canvas, alert_str, self.fonts['Roboto']['Small'])
+        # Shorten the alert title until the alert fits in allocated space
+        font = self.f_roboto_small
+        time_frame_str = f"{preposition} {time.strftime(self.month_day)} {time.strftime(self.hour_minute_ampm).lower()}"
+        alert_text = _truncate(alert.title
+                            , lambda s: font.getlength(f'{s} {time_frame_str}') <= max_alert_width)
 
-            # If it fits, break the loop
-            if alert.width <= max_alert_width:
-                break
+        # The alert is drawn into a strip cut from the bottom of the image,
+        # then pasted back in one go
+        region_y = self.display.height - 25
+        region = img.crop((0, region_y, self.display.width, self.display.height))
+        canvas = ImageDraw.Draw(region)
 
-            alert_text = alert_text[:-2] + '…'
+        alert = dh.Text(canvas, f'{alert_text} {time_frame_str}', font)
 
-        # Load border edges
-        img_border_edge_left = Image.open(self.assests_path / 'images/border_edge_left.bmp')
-        img_border_edge_right = Image.open(self.assests_path / 'images/border_edge_right.bmp')
+        # Border edges are loaded in __init__
+        img_border_edge_left = self._border_left
+        img_border_edge_right = self._border_right
 
-        # Coordinates
+        # Coordinates, relative to the strip
         background_start_x = int((self.display.width - alert.width) / 2)
-        background_start_y = self.display.height - 25
+        background_start_y = 0
 
         # Centered, match start coords
         background_end_x = background_start_x + alert.width
-        background_end_y = self.display.height
+        background_end_y = region.height
 
         border_left_start = (background_start_x - img_border_edge_left.width
                             , background_start_y)
@@ -744,30 +875,23 @@ class Dashboard():
         alert_end_y = background_end_y - 2
 
         # Draw background (rounded corners)
-        self.canvas.rectangle((background_start_x, background_start_y, background_end_x
+        canvas.rectangle((background_start_x, background_start_y, background_end_x
                         , background_end_y), fill=0)
-        img.paste(img_border_edge_left, border_left_start)
-        img.paste(img_border_edge_right, border_right_start)
+        region.paste(img_border_edge_left, border_left_start)
+        region.paste(img_border_edge_right, border_right_start)
 
 
         # Draw
         alert.write((alert_start_x, alert_start_y), (alert_end_x, alert_end_y)
-                    , CENTER, MIDDLE, fill='white')
+                    , _CENTER, _MIDDLE, fill='white')
+
+        img.paste(region, (0, region_y))
 
         log.debug('Exiting draw_alerts()')
 
     def draw_upcoming_events(self):
         log.debug('Entering draw_upcoming_events()')
 
-        # Alignment aliases
-        TOP = dh.VerticalAlignment.TOP
-        MIDDLE = dh.VerticalAlignment.MIDDLE
-        BOTTOM = dh.VerticalAlignment.BOTTOM
-
-        LEFT = dh.HorizontalAlignment.LEFT
-        CENTER = dh.HorizontalAlignment.CENTER
-        RIGHT = dh.HorizontalAlignment.RIGHT
-
         MAX_Y = 356
         date_padding = 4
 
@@ -792,64 +916,84 @@ class Dashboard():
         event_row_inner_padding = 1
         event_row_outer_pading = 10
 
-        # Initial draw coordinates
-        x_offset = 453
-        y_offset = 27
+        # The events are drawn into a tile cut from the right side of the image,
+        # then pasted back in one go, rather than drawing each glyph and line
+        # onto the full size image. The tile runs to the right edge of the image
+        # and down to the alert strip, so text that spills past MAX_Y or the
+        # event width isn't clipped
+        region_x = 453
+        region_y = 27
+        box = (region_x, region_y, self.display.width, self.display.height - 25)
+
+        # Work out the text for every date and event first
+        # The drawing below only measures and draws it, and is skipped
+        # entirely when the text hasn't changed since the last refresh
+        days = []
+        for key, val in self.calendar:
+            events = []
+            for item in val:
+                # Ensure event title fits width and doesn't span too many rows
+                title_lines = _wrap_truncated(item.event_name
+                                , CALENDAR_TITLE_MAX_CHARS, CALENDAR_TITLE_MAX_ROWS)
+
+                # Time frame
+                if item.all_day_event:
+                    time_frame_str = 'All day'
+                elif item.end_date is None:
+                    time_frame_str = f'Starting at {_fmt_ampm(item.start_date)}'
+                elif item.start_date is None:
+                    time_frame_str = f'Until {_fmt_ampm(item.end_date)}'
+                else:
+                    time_frame_str = f'{_fmt_ampm(item.start_date)} - {_fmt_ampm(item.end_date)}'
+
+                events.append((tuple(title_lines), time_frame_str))
+
+            days.append((key.strftime('%a'), str(key.day), tuple(events)))
+
+        def draw():
+            region = self._canvas_img.crop(box)
+            canvas = ImageDraw.Draw(region)
 
-        # Loop through calendar events until an event won't in allocated space
-        # Loop through keys (dates)
-        while True:
+            # Initial draw coordinates, relative to the tile
+            x_offset = 0
+            y_offset = 0
+
+            # Loop through calendar events until an event won't fit in allocated space
+            # Loop through dates
+            overflow = False
             line_coords = None
-            for key, val in self.calendar:
+            for dow_str, day_str, events in days:
                 # Track whether the date has been drawn
                 # So that we only draw it when we know
                 # there's enough space for another event
                 date_drawn = False
 
-                for item_number, item in enumerate(val):
+                for item_number, (title_lines, time_frame_str) in enumerate(events):
                     event_rows = []
-                    events_remaining = len(val) - 1 - item_number
-
-                    # Ensure event title fits width and doesn't span too many rows
-                    title_str = item.event_name
-                    while len(textwrap.wrap(title_str, CALENDAR_TITLE_MAX_CHARS)) > CALENDAR_TITLE_MAX_ROWS:
-                        title_str = title_str[:-2] + '…'
 
                     total_event_height = 0
-                    for line in textwrap.wrap(title_str, CALENDAR_TITLE_MAX_CHARS):
-                        new_line = dh.Text(self.canvas, line, self.fonts['Roboto']['Small'])
+                    for line in title_lines:
+                        new_line = dh.Text(canvas, line, self.f_roboto_small)
                         event_rows.append(new_line)
                         total_event_height += event_row_height + event_row_inner_padding
 
-                    # Create objects for time frame
-                    if item.all_day_event:
-                        time_frame_str = 'All day'
-                    elif item.end_date is None:
-                        time_frame_str = ('Starting at '
-                                    f'{item.start_date.strftime(self.hour_minute_ampm)[:-1].lower()}')
-                    elif item.start_date is None:
-                        time_frame_str = ('Until '
-                                    f'{item.end_date.strftime(self.hour_minute_ampm)[:-1].lower()}')
-                    else:
-                        time_frame_str = (f'{item.start_date.strftime(self.hour_minute_ampm)[:-1].lower()} - '
-                                    f'{item.end_date.strftime(self.hour_minute_ampm)[:-1].lower()}')
-
-                    time_frame = dh.Text(self.canvas, time_frame_str, self.fonts['Roboto']['Small'])
+                    time_frame = dh.Text(canvas, time_frame_str, self.f_roboto_small)
                     event_rows.append(time_frame)
 
                     ending_y = y_offset + total_event_height + time_frame.height
-                    if ending_y > MAX_Y:
-                        # If we don't have room to write everything, exit
-                        return
+                    if ending_y > MAX_Y - region_y:
+                        # If we don't have room to write everything, stop
+                        overflow = True
+                        break
 
                     if not date_drawn:
                         if line_coords:
-                            self.canvas.line(line_coords, width=1)
+                            canvas.line(line_coords, width=1)
                             y_offset += date_padding
 
                         # Output day of week and day
-                        dow = dh.Text(self.canvas, key.strftime('%a'), self.fonts['Roboto']['Small'])
-                        day = dh.Text(self.canvas, str(key.day), self.fonts['RobotoBold']['Medium'])
+                        dow = dh.Text(canvas, dow_str, self.f_roboto_small)
+                        day = dh.Text(canvas, day_str, self.f_bold_medium)
 
                         # Coordinates
                         dow_start = (dow_start_x + x_offset, dow_start_y + y_offset)
@@ -857,30 +1001,31 @@ class Dashboard():
                         day_start = (day_start_x + x_offset, day_start_y + y_offset)
                         day_end = (day_end_x + x_offset, day_end_y + y_offset)
 
-                        dow.write(dow_start, dow_end, CENTER, TOP)
-                        day.write(day_start, day_end, CENTER, TOP)
+                        dow.write(dow_start, dow_end, _CENTER, _TOP)
+                        day.write(day_start, day_end, _CENTER, _TOP)
                         date_drawn = True
 
+                    # Lines within the event use the event inner padding
+                    # The last line uses the padding between dates if this is the
+                    # date's last event, otherwise the event outer padding
+                    if item_number == len(events) - 1:
+                        last_line_padding = date_padding
+                    else:
+                        last_line_padding = event_row_outer_pading
+                    row_paddings = ([event_row_inner_padding] * (len(event_rows) - 1)
+                                    + [last_line_padding])
+
                     # Output all lines in event title
-                    for line_number, line in enumerate(event_rows):
-                        lines_remaining = len(event_rows) - 1 - line_number
+                    for line, row_padding in zip(event_rows, row_paddings):
                         line_start = (x_offset + event_row_start_x, y_offset)
                         line_end = (x_offset + event_row_start_x + event_row_width
                                     , y_offset + event_row_height)
-                        line.write(line_start, line_end, LEFT, MIDDLE)
-
-                        if lines_remaining == 0:
-                            if events_remaining == 0:
-                                # Last line, but no more events on date
-                                # Use padding between dates
-                                y_offset += event_row_height + date_padding
-                            else:
-                                # Last line, but there are more events on this date
-                                # Use event outer padding
-                                y_offset += event_row_height + event_row_outer_pading
-                        else:
-                            # More lines for event, use event inner padding
-                            y_offset += event_row_height + event_row_inner_padding
+                        line.write(line_start, line_end, _LEFT, _MIDDLE)
+
+                        y_offset += event_row_height + row_padding
+
+                if overflow:
+                    break
 
                 # If the dow ends below the event, move the y coordinate down
                 # to give proper padding between the bottom of the text
@@ -891,4 +1036,8 @@ class Dashboard():
                 # Draw line separating dates
                 line_coords = (x_offset, y_offset, x_offset + 178, y_offset)
 
+            self._canvas_img.paste(region, box[:2])
+
+        self._draw_cached_panel('calendar', box, tuple(days), draw)
+
         log.debug('Exiting draw_upcoming_events()')
\ No newline at end of file
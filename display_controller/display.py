@@ -6,12 +6,11 @@
 __author__ = 'Eric J. Harlan'
 __license__ = "GPLv3"
 
-from abc import ABC, abstractmethod
 import logging
 
 log = logging.getLogger(__name__)
 
-class Display(ABC):
+class Display():
     '''
         Base class for the display.
         Hardware specific classes inherit from this class.
@@ -46,12 +45,10 @@ class Display(ABC):
             f'It is currently {debug_str}'
         )
 
-    @abstractmethod
     def display_image(self, image):
         ''' To be implemented by derived class '''
-        pass
+        raise NotImplementedError(f'{type(self).__name__} does not implement display_image()')
 
-    @abstractmethod
     def clear(self):
         ''' To be implemented by derived class '''
-        pass
\ No newline at end of file
+        raise NotImplementedError(f'{type(self).__name__} does not implement clear()')
\ No newline at end of file
@@ -12,26 +12,44 @@ __license__ = "GPLv3"
 from display_controller.display import *
 
 import atexit
+from dataclasses import dataclass
+import functools
 import importlib
 import logging
 import time
 
 log = logging.getLogger(__name__)
 
-# Dictionary with properties of supported display models
+@dataclass(slots=True, frozen=True)
+class DisplaySpec():
+    '''
+        Properties of a supported display model
+        mono_buffer: The driver's getbuffer() packs the image 1 bit per pixel, inverted
+    '''
+    width: int
+    height: int
+    driver_module: str
+    mono_buffer: bool
+
+# Supported display models, keyed by the casefolded model name
 supported_models = {
-    'epd7in5': {
-        'width': 640,
-        'height': 384,
-        'driver_module': 'epd7in5'
-    },
-    'epd7in5_v2': {
-        'width': 800,
-        'height': 480,
-        'driver_module': 'epd7in5_V2'
-    }
+    'epd7in5': DisplaySpec(
+        width= 640
+        , height= 384
+        , driver_module= 'epd7in5'
+        , mono_buffer= False
+    ),
+    'epd7in5_v2': DisplaySpec(
+        width= 800
+        , height= 480
+        , driver_module= 'epd7in5_V2'
+        , mono_buffer= True
+    )
 }
 
+# Translation table that flips every bit in a byte, see _getbuffer()
+_INVERT_BYTES = bytes(0xFF ^ i for i in range(256))
+
 class Waveshare_ePaper(Display):
     def __init__(self, model, debug_mode):
         model = model.casefold()
@@ -40,16 +58,76 @@ class Waveshare_ePaper(Display):
             log.exception(f'{model} is not a supported display model')
             raise NotImplementedError(f'{model} is not a supported display model')
 
+        spec = supported_models[model]
+
         super().__init__(
             brand= 'Waveshare',
             model= model,
             display_type= 'ePaper',
-            width= supported_models[model]['width'],
-            height= supported_models[model]['height'],
+            width= spec.width,
+            height= spec.height,
             debug_mode= debug_mode
         )
 
-        self.driver_module_name = supported_models[model]['driver_module']
+        self.driver_module_name = spec.driver_module
+        self.mono_buffer = spec.mono_buffer
+
+    def __getstate__(self):
+        '''
+            The display is pickled with the session
+            Modules can't be pickled, so leave the driver out.
+            It's loaded again the first time it's needed
+        '''
+        state = self.__dict__.copy()
+        # Sessions pickled before cached_property was used have these instead
+        for key in ('driver_module', 'epd', '_driver_module', '_epd'):
+            state.pop(key, None)
+        return state
+
+    @functools.cached_property
+    def driver_module(self):
+        '''
+            The Waveshare driver module for the model
+            Only imported once, the first time it's needed
+        '''
+        driver_module = importlib.import_module(
+            f'display_controller.waveshare.{self.driver_module_name}')
+
+        # Release the GPIO pins when the app exits
+        atexit.register(self.cleanup)
+
+        return driver_module
+
+    @functools.cached_property
+    def epd(self):
+        ''' The driver's EPD object, created once '''
+        return self.driver_module.EPD()
+
+    def _getbuffer(self, image):
+        '''
+            Returns the same buffer as the driver's getbuffer()
+
+            For 1 bit displays, the driver inverts the packed image one byte
+            at a time in Python. Here the bytes are inverted with a single
+            bytes.translate() call instead
+        '''
+        epd = self.epd
+
+        # Displays restored from sessions saved before mono_buffer existed won't have it
+        if not getattr(self, 'mono_buffer', False):
+            return epd.getbuffer(image)
+
+        if image.size == (epd.width, epd.height):
+            img = image.convert('1')
+        elif image.size == (epd.height, epd.width):
+            # Image has correct dimensions, but needs to be rotated
+            img = image.rotate(90, expand=True).convert('1')
+        else:
+            # Let the driver log the wrong dimensions and return a blank buffer
+            return epd.getbuffer(image)
+
+        # PIL uses 1 for white, the display uses 1 for black
+        return bytearray(img.tobytes('raw').translate(_INVERT_BYTES))
 
     def display_image(self, image, sleep_display=True):
         if self.debug_mode:
@@ -59,29 +137,37 @@ class Waveshare_ePaper(Display):
                 log.info('Pushing image to display...')
 
                 log.info('Initializing screen...')
-                driver_module = importlib.import_module(f'display_controller.waveshare.{self.driver_module_name}')
-                epd = driver_module.EPD()
+                epd = self.epd
                 epd.init()
                 epd.Clear()
 
-                epd.display(epd.getbuffer(image))
+                epd.display(self._getbuffer(image))
                 time.sleep(2)
             except KeyboardInterrupt:
                 log.info('Keyboard interrupt detected, exiting.')
-                driver_module.epdconfig.module_exit(cleanup=True)
+                self.cleanup()
             except Exception as e:
                 log.exception('Exception thrown when displaying image.')
             finally:
-                if sleep_display:
+                # Nothing to put to sleep if the driver failed to load
+                if sleep_display and 'epd' in self.__dict__:
                     log.info('Putting display to sleep')
-                    epd.sleep()
+                    self.epd.sleep()
+
+    def cleanup(self):
+        '''
+            Closes the SPI device and GPIO pins
+            Nothing to do if the driver was never loaded
+        '''
+        if 'driver_module' in self.__dict__:
+            log.debug('Cleaning up display driver')
+            self.driver_module.epdconfig.module_exit(cleanup=True)
 
     def clear(self):
         if self.debug_mode:
             log.info('debug_mode = True, display will not be cleared.')
         else:
-            driver_module = importlib.import_module(self.driver_module_name)
-            epd = driver_module.EPD()
+            epd = self.epd
 
             epd.init()
             epd.Clear()
@@ -12,6 +12,7 @@ __license__ = "GPLv3"
 
 from PIL import Image, ImageDraw, ImageFont
 from enum import Enum
+import functools
 
 DEBUG_BORDERS = False
 
@@ -25,15 +26,27 @@ class HorizontalAlignment(Enum):
     CENTER = 2
     RIGHT = 3
 
+@functools.lru_cache(maxsize=512)
+def _text_bbox(text, font, fontmode):
+    '''
+        Returns the bounding box of text drawn at (0, 0)
+        Matches canvas.textbbox() for a single line of text. Cached, since
+        the same strings are measured on every refresh
+    '''
+    return font.getbbox(text, fontmode)
+
 class Text():
     '''
         Maintains PIL drawtext text and properties
     '''
+    # A few dozen of these are made for every refresh, skip the instance dicts
+    __slots__ = ('canvas', 'text', 'font', 'width', 'height')
+
     def __init__(self, canvas, text, font):
         self.canvas = canvas
         self.text = text
         self.font = font
-        _, _, self.width, self.height = canvas.textbbox((0, 0), text, font= font)
+        _, _, self.width, self.height = _text_bbox(text, font, canvas.fontmode)
 
     def coords(self):
         return (self.width, self.height)
@@ -44,6 +57,10 @@ class Text():
                         , v_align=VerticalAlignment.TOP
                         , fill=0):
 
+        # Nothing to draw for an empty string, skip the alignment math and PIL
+        if not self.text:
+            return
+
         # Default drawing coordinates to start
         draw_x, draw_y = start_coords
 
@@ -82,4 +99,27 @@ class Text():
 
         # Debug Borders
         if DEBUG_BORDERS:
-            self.canvas.rectangle((start_coords, end_coords), outline='black', fill=None)
\ No newline at end of file
+            self.canvas.rectangle((start_coords, end_coords), outline='black', fill=None)
+
+def draw_column(canvas, x, width, cells, fill=0):
+    '''
+        Draws a column of text, each cell centered horizontally and vertically
+
+        Pillow centers the text itself (anchor='mm'), so the text doesn't
+        need to be measured first, like it does with a Text object
+
+        Parameters:
+            canvas: The ImageDraw to draw on
+            x: The left edge of the column
+            width: The width of the column
+            cells: An iterable of (y, height, text, font) for each cell
+            fill: The text color
+    '''
+    center_x = x + width / 2
+
+    for y, height, text, font in cells:
+        canvas.text((center_x, y + height / 2), text, font= font, anchor= 'mm', fill= fill)
+
+        # Debug Borders
+        if DEBUG_BORDERS:
+            canvas.rectangle(((x, y), (x + width, y + height)), outline='black', fill=None)
\ No newline at end of file
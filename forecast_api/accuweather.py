@@ -10,15 +10,32 @@ __license__ = "GPLv3"
 from forecast_api.forecastdata import *
 from forecast_api.weatherforecast import *
 
-from datetime import date, datetime, time, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+import hashlib
 import json
 import logging
+import os
+from pathlib import Path
+import random
 import requests
+from requests.utils import DEFAULT_ACCEPT_ENCODING
 
 log = logging.getLogger(__name__)
 
+# Location lookups for each lat_long, saved between runs. See _get_location_key()
+LOCATION_CACHE_PATH = Path(__file__).resolve().parent / 'accuweather_location.json'
+LOCATION_CACHE_TTL = timedelta(days= 30)
+
+# Status code returned by _make_request when no response was received
+NO_RESPONSE_STATUS = 599
+
+# Failed requests are retried after an hour, doubling with each failure in a row
+RETRY_DELAY = timedelta(hours= 1)
+RETRY_DELAY_MAX = timedelta(hours= 6)
+
 class AccuWeather(WeatherForecast):
-    def __init__(self, api_key, unit_type, lat_long, time_zone, nws_user_agent=None):
+    def __init__(self, api_key, unit_type, lat_long, time_zone, nws_user_agent=None, details=True):
         self._MAX_API_CALLS = 50 # Free service offers 50 free api requests
 
         super().__init__(
@@ -32,8 +49,25 @@ class AccuWeather(WeatherForecast):
         self._location_key = None
         self._base_url = 'http://dataservice.accuweather.com'
 
+        # Request parameters and the response's unit key don't change between requests
+        # Full details include Real Feel, humidity, sunrise/sunset and precipitation
+        # Without them the payloads are much smaller, and those values are left empty
+        self._details = details
+        self._current_params = {'details': 'true' if details else 'false'}
+        self._forecast_params = {
+            'details': 'true' if details else 'false'
+            , 'metric': 'true' if self.unit_type == 'metric' else 'false'
+        }
+        self._unit_key = str(self.unit_type).title()
+
+        # ETag and Last-Modified validators from the last response for each
+        # forecast end point, sent back so unchanged forecasts come back as a 304
+        self._validators = {}
+
         self.has_nighttime_forecasts = True
         self.api_calls_remaining = self._MAX_API_CALLS
+        # When a response last reported no calls remaining, None while there are calls left
+        self._calls_exhausted_at = None
 
         # refresh_tolerance_mins allows a refresh to occur if the
         # refresh is coming up in the near future
@@ -82,71 +116,158 @@ class AccuWeather(WeatherForecast):
             , 44: '\uf02a'  # Mostly Cloudy w/ Snow
         }
 
+        # The icon codes are small ints, so index a tuple by code instead of hashing into the map
+        # Unused codes (0, 9, 10, 27, 28) get the alien icon, matching OpenWeather's unknown icon
+        self._weather_icons = tuple(self._weather_icon_map.get(code, '\uf075')
+                                    for code in range(max(self._weather_icon_map) + 1))
+
+        # AccuWeather capitalizes its precipitation types ('Rain', 'Snow', ...)
+        # Key the icons the same way, so responses don't need to be lowercased
+        self._precip_icons = {precip_type.capitalize(): icon
+                                for precip_type, icon in self._precip_icon_map.items()}
+
         self._headers = {
-            'Accept-Encoding': 'gzip'
+            # Includes br when brotli is installed, since urllib3 can only decode it then
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING
             , 'Accept-Language': 'en-US'
         }
 
-        self._get_location_key()
+        # Every call goes to the same host, so the location and forecast requests share
+        # the session's connections. The forecast requests run at the same time
+        self._session = self._build_session(self._headers, pool_maxsize= 8)
 
-    def _make_request(self, end_point, headers, params={}):
+    def _make_request(self, end_point, headers, params=None, conditional=False):
         '''
             Makes an API call to the AccuWeather service
+
+            If conditional is True, the validators from the last response for
+            the end point are sent. If the server replies 304 (Not Modified),
+            None is returned in place of the JSON
+
+            Also returns a digest of the response body, so callers can tell
+            an unchanged payload apart without parsing it into forecasts
+
+            The forecast end points include the location key, which refresh()
+            looks up before any of them are requested
         '''
         log.debug(f'Entering _make_request() for endpoint {end_point}')
 
         url = f'{self._base_url}/{end_point}'
 
+        if conditional and end_point in self._validators:
+            headers = {**headers, **self._validators[end_point]}
+
         # Add API Key to params
-        params['apikey'] = self.api_key
+        # Copy them, the callers' params are reused between requests
+        params = {**(params or {}), 'apikey': self.api_key}
 
-        if self._location_key is None:
-            lookup_success = self._get_location_key
-        else:
-            lookup_success = True
+        response = None
+        try:
+            response = self._session.get(url, headers=headers, params=params
+                                        , timeout= REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except Exception as err: #requests.exceptions.HTTPError as err:
+            log.exception(f'Request failed.')
+
+            # Timeouts and connection errors leave nothing to look at
+            if response is None:
+                log.debug('Exiting _make_request() without a response')
+                return {}, NO_RESPONSE_STATUS, None
+
+            self._log_response_details(response)
 
-        if not lookup_success:
-            log.error('Invalid location key. Request will not be made.')
+        self.api_calls_remaining = int(response.headers.get('RateLimit-Remaining', -1))
+        log.info(f'{self.api_calls_remaining} AccuWeather API calls remaining')
+
+        if self.api_calls_remaining == 0:
+            self._calls_exhausted_at = datetime.now()
         else:
-            try:
-                response = requests.get(url, headers=headers, params=params)
-                response.raise_for_status()
-            except Exception as err: #requests.exceptions.HTTPError as err:
-                log.exception(f'Request failed.')
+            self._calls_exhausted_at = None
+
+        if response.status_code == requests.codes.not_modified: # pylint: disable=no-member
+            log.debug('Exiting _make_request() with 304 Not Modified')
+            return None, response.status_code, None
 
-                self._log_response_details(response)
+        if conditional and response.status_code == requests.codes.ok: # pylint: disable=no-member
+            validators = {}
+            if 'ETag' in response.headers:
+                validators['If-None-Match'] = response.headers['ETag']
+            if 'Last-Modified' in response.headers:
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            self._validators[end_point] = validators
 
-            self.api_calls_remaining = int(response.headers.get('RateLimit-Remaining', -1))
-            log.info(f'{self.api_calls_remaining} AccuWeather API calls remaining')
+        digest = hashlib.blake2b(response.content, digest_size= 16).digest()
 
         log.debug('Exiting _make_request()')
-        return response.json(), response.status_code
+        return response.json(), response.status_code, digest
+
+    def _load_location_cache(self):
+        '''
+            Returns the saved location lookups, keyed by lat_long
+            Returns an empty dictionary if there's no usable cache file
+        '''
+        if not LOCATION_CACHE_PATH.is_file():
+            return {}
+
+        try:
+            with open(LOCATION_CACHE_PATH, 'r', encoding= 'utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            log.exception('Failed to load the location cache.')
+            return {}
+
+    def _save_location_cache(self, cache):
+        '''
+            Writes the location lookups to the cache file
+        '''
+        # Write to a temp file and swap it in, so a partial write is never read
+        temp_path = LOCATION_CACHE_PATH.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding= 'utf-8') as f:
+                json.dump(cache, f)
+            os.replace(temp_path, LOCATION_CACHE_PATH)
+        except OSError:
+            log.exception('Failed to save the location cache.')
 
     def _get_location_key(self):
         '''
             https://www.developer.accuweather.com/accuweather-locations-api/apis/get/locations/v1/cities/geoposition/search
 
             Hits the GeoPosition Search end point
-            If found, the Location Key of the top result is returned
-            Otherwise, an error is thrown
+            If found, the Location Key of the top result is saved
+            Returns whether a Location Key is available
+
+            Retries aren't scheduled here, refresh() does that for the
+            collections that were waiting on the key
         '''
         log.debug('Entering _get_location_key()')
 
         end_point = 'locations/v1/cities/geoposition/search'
         lookup_success = False
 
+        # The location for a lat_long doesn't change, so use the saved lookup
+        # while it's fresh rather than spending one of the daily API calls
+        if self._location_key is None:
+            cache = self._load_location_cache()
+            cached = cache.get(self.lat_long)
+
+            if cached and datetime.now() - datetime.fromisoformat(cached['cached_at']) < LOCATION_CACHE_TTL:
+                log.debug('Using saved location lookup')
+                self._location_key = cached['key']
+                self.city = cached['city']
+                self.state = cached['state']
+                self.state_abbrev = cached['state_abbrev']
+                self.country = cached['country']
+                self.country_abbrev = cached['country_abbrev']
+
+                lookup_success = True
+
         if self._location_key is None:
             params = {'q': self.lat_long}
-            response, response_status_code = self._make_request(end_point, self._headers, params)
+            response, response_status_code, _ = self._make_request(end_point, self._headers, params)
 
             if response_status_code != requests.codes.ok: # pylint: disable=no-member
-                new_refresh = datetime.now() + timedelta(hours=1)
-                log.error(f'Location Key request failed. Setting next refresh for {new_refresh}.')
-
-                self.current_conditions.next_refresh = new_refresh
-                self.hourly_forecasts.next_refresh = new_refresh
-                self.daily_forecasts.next_refresh = new_refresh
-                self.alerts.next_refresh = new_refresh
+                log.error('Location Key request failed.')
             else:
                 if 'Key' in response:
                     self._location_key = response.get('Key')
@@ -156,6 +277,17 @@ class AccuWeather(WeatherForecast):
                     self.country = response.get('Country').get('LocalizedName')
                     self.country_abbrev = response.get('Country').get('ID')
 
+                    cache[self.lat_long] = {
+                        'key': self._location_key
+                        , 'city': self.city
+                        , 'state': self.state
+                        , 'state_abbrev': self.state_abbrev
+                        , 'country': self.country
+                        , 'country_abbrev': self.country_abbrev
+                        , 'cached_at': datetime.now().isoformat()
+                    }
+                    self._save_location_cache(cache)
+
                     lookup_success = True
                 else:
                     raise RuntimeError('Unable to find Location Key in response.')
@@ -174,19 +306,26 @@ class AccuWeather(WeatherForecast):
         '''
         log.debug('Entering _get_current_conditions()')
 
+        now = datetime.now()
+
         end_point = f'currentconditions/v1/{self._location_key}'
         forecast_updated = False
 
-        # Get full details so that payload includes Real Feel
-        params = {'details': 'true'}
-
         # Response is an list, grab the first (and only) item
-        response, response_status_code = self._make_request(end_point, self._headers, params)
-
-        if response_status_code != requests.codes.ok: # pylint: disable=no-member
-            new_refresh = datetime.now() + timedelta(hours=1)
-            log.error(f'Current Conditions request failed. Setting next refresh for {new_refresh}.')
-            self.current_conditions.next_refresh = new_refresh
+        response, response_status_code, digest = self._make_request(end_point, self._headers, self._current_params
+                                                                    , conditional= True)
+
+        if response_status_code == requests.codes.not_modified: # pylint: disable=no-member
+            log.debug('Current Conditions have not changed')
+            self.current_conditions.next_refresh = now + timedelta(hours=1)
+            self.current_conditions.fail_count = 0
+        elif response_status_code != requests.codes.ok: # pylint: disable=no-member
+            self._schedule_retry(self.current_conditions, 'Current Conditions', now)
+        elif digest == self.current_conditions.digest:
+            # Same payload as last time, no need to parse it again
+            log.debug('Current Conditions response is unchanged')
+            self.current_conditions.next_refresh = now + timedelta(hours=1)
+            self.current_conditions.fail_count = 0
         else:
             response = response[0]
 
@@ -194,16 +333,23 @@ class AccuWeather(WeatherForecast):
             forecast_date = response['LocalObservationDateTime']
 
             precipitation_type = response.get('PrecipitationType', None)
-            precipitation_icon = self._precip_icon_map.get(str(precipitation_type).lower(), '\uf084')
+            precipitation_icon = self._precip_icons.get(precipitation_type, '\uf084')
+
+            if self._details:
+                feels_like_temperature = response['RealFeelTemperature'][self._unit_key]['Value']
+                relative_humidity = response['RelativeHumidity']
+            else:
+                feels_like_temperature = None
+                relative_humidity = None
 
             new_forecast = ForecastData(
-                forecast_datetime= datetime.strptime(forecast_date, '%Y-%m-%dT%H:%M:%S%z')
-                , current_temperature= response['Temperature'][str(self.unit_type).title()]['Value']
-                , feels_like_temperature= response['RealFeelTemperature'][str(self.unit_type).title()]['Value']
+                forecast_datetime= datetime.fromisoformat(forecast_date)
+                , current_temperature= response['Temperature'][self._unit_key]['Value']
+                , feels_like_temperature= feels_like_temperature
                 , weather_icon_raw= response['WeatherIcon']
-                , weather_icon= self._weather_icon_map[response['WeatherIcon']]
+                , weather_icon= self._weather_icons[response['WeatherIcon']]
                 , weather_text= response['WeatherText']
-                , relative_humidity= response['RelativeHumidity']
+                , relative_humidity= relative_humidity
 
                 , precipitation_type= precipitation_type
                 , precipitation_icon= precipitation_icon
@@ -212,7 +358,8 @@ class AccuWeather(WeatherForecast):
             forecast_collection = ForecastDataCollection(
                 forecasts=[new_forecast]
                 # Set forecast refresh time to 1 hour from now
-                , next_refresh= datetime.now() + timedelta(hours=1)
+                , next_refresh= now + timedelta(hours=1)
+                , digest= digest
             )
 
             # If response doesn't match existing data, indicate that the forecast was updated
@@ -225,6 +372,36 @@ class AccuWeather(WeatherForecast):
         log.debug('Exiting _get_current_conditions()')
         return forecast_updated
 
+    def _parse_hourly_forecast(self, item):
+        '''
+            Returns a ForecastData object for an item in the 12 hour forecast
+        '''
+        precipitation_type = item.get('PrecipitationType', None)
+
+        if self._details:
+            feels_like_temperature = item['RealFeelTemperature']['Value']
+            relative_humidity = item['RelativeHumidity']
+            precipitation_amount = item['TotalLiquid']['Value']
+        else:
+            feels_like_temperature = None
+            relative_humidity = None
+            precipitation_amount = None
+
+        return ForecastData(
+            forecast_datetime= datetime.fromisoformat(item['DateTime'])
+            , current_temperature= item['Temperature']['Value']
+            , feels_like_temperature= feels_like_temperature
+            , weather_icon_raw = item['WeatherIcon']
+            , weather_icon= self._weather_icons[item['WeatherIcon']]
+            , weather_text= item['IconPhrase']
+            , relative_humidity= relative_humidity
+
+            , precipitation_type= precipitation_type
+            , precipitation_icon= self._precip_icons.get(precipitation_type, '\uf084')
+            , precipitation_probability= item['PrecipitationProbability']
+            , precipitation_amount= precipitation_amount
+        )
+
     def _get_hourly_forecast(self):
         '''
             https://www.developer.accuweather.com/accuweather-forecast-api/apis/get/forecasts/v1/hourly/12hour/%7BlocationKey%7D
@@ -236,58 +413,40 @@ class AccuWeather(WeatherForecast):
         '''
         log.debug('Entering _get_hourly_forecast()')
 
+        now = datetime.now()
+
         end_point = f'forecasts/v1/hourly/12hour/{self._location_key}'
         forecast_updated = False
 
-        # Get full details so that payload includes Real Feel
-        params = {'details': 'true'}
-
-        if self.unit_type == 'metric':
-            params['metric'] = 'true'
-        else:
-            params['metric'] = 'false'
-
-        response, response_status_code = self._make_request(end_point, self._headers, params)
-
-        if response_status_code != requests.codes.ok: # pylint: disable=no-member
-            new_refresh = datetime.now() + timedelta(hours=1)
-            log.error(f'Hourly Forecast request failed. Setting next refresh for {new_refresh}.')
-            self.hourly_forecasts.next_refresh = new_refresh
+        response, response_status_code, digest = self._make_request(end_point, self._headers, self._forecast_params
+                                                                    , conditional= True)
+
+        if response_status_code == requests.codes.not_modified: # pylint: disable=no-member
+            log.debug('Hourly Forecast has not changed')
+            self.hourly_forecasts.next_refresh = now + timedelta(hours=1)
+            self.hourly_forecasts.fail_count = 0
+        elif response_status_code != requests.codes.ok: # pylint: disable=no-member
+            self._schedule_retry(self.hourly_forecasts, 'Hourly Forecast', now)
+        elif digest == self.hourly_forecasts.digest:
+            # Same payload as last time, no need to parse it again
+            log.debug('Hourly Forecast response is unchanged')
+            self.hourly_forecasts.next_refresh = now + timedelta(hours=1)
+            self.hourly_forecasts.fail_count = 0
         else:
-            # Loop through all forecast items, adding them to a list
-            new_forecasts = []
+            # Parse all forecast items into a list
             log.debug(f'Parsing {len(response)} elements...')
-            for item in response:
-                forecast_date = item['DateTime']
-                precipitation_type = item.get('PrecipitationType', None)
-                precipitation_icon = self._precip_icon_map.get(str(precipitation_type).lower(), '\uf084')
-
-                new_item = ForecastData(
-                    forecast_datetime= datetime.strptime(forecast_date, '%Y-%m-%dT%H:%M:%S%z')
-                    , current_temperature= item['Temperature']['Value']
-                    , feels_like_temperature= item['RealFeelTemperature']['Value']
-                    , weather_icon_raw = item['WeatherIcon']
-                    , weather_icon= self._weather_icon_map[item['WeatherIcon']]
-                    , weather_text= item['IconPhrase']
-                    , relative_humidity= item['RelativeHumidity']
-
-                    , precipitation_type= precipitation_type
-                    , precipitation_icon= precipitation_icon
-                    , precipitation_probability= item['PrecipitationProbability']
-                    , precipitation_amount=item['TotalLiquid']['Value']
-                )
-
-                new_forecasts.append(new_item)
+            new_forecasts = [self._parse_hourly_forecast(item) for item in response]
 
             forecast_collection = ForecastDataCollection(
                 forecasts=new_forecasts
                 # Set forecast refresh time to 1 hour from now
-                , next_refresh= datetime.now() + timedelta(hours=1)
+                , next_refresh= now + timedelta(hours=1)
+                , digest= digest
             )
 
             # If response doesn't match existing data, indicate that the forecast was updated
             # Always update the object so next_refresh is accurate
-            if self.current_conditions != forecast_collection:
+            if self.hourly_forecasts != forecast_collection:
                 forecast_updated = True
 
             self.hourly_forecasts = forecast_collection
@@ -306,23 +465,25 @@ class AccuWeather(WeatherForecast):
         '''
         log.debug('Entering _get_daily_forecast()')
 
+        now = datetime.now()
+
         end_point = f'forecasts/v1/daily/5day/{self._location_key}'
         forecast_updated = False
 
-        # Get full details so that payload includes Real Feel
-        params = {'details': 'true'}
-
-        if self.unit_type == 'metric':
-            params['metric'] = 'true'
-        else:
-            params['metric'] = 'false'
-
-        response, response_status_code = self._make_request(end_point, self._headers, params)
-
-        if response_status_code != requests.codes.ok: # pylint: disable=no-member
-            new_refresh = datetime.now() + timedelta(hours=1)
-            log.error(f'Daily Forecast request failed. Setting next refresh for {new_refresh}.')
-            self.daily_forecasts.next_refresh = new_refresh
+        response, response_status_code, digest = self._make_request(end_point, self._headers, self._forecast_params
+                                                                    , conditional= True)
+
+        if response_status_code == requests.codes.not_modified: # pylint: disable=no-member
+            log.debug('Daily Forecast has not changed')
+            self.daily_forecasts.next_refresh = self._get_daily_next_refresh(now)
+            self.daily_forecasts.fail_count = 0
+        elif response_status_code != requests.codes.ok: # pylint: disable=no-member
+            self._schedule_retry(self.daily_forecasts, 'Daily Forecast', now)
+        elif digest == self.daily_forecasts.digest:
+            # Same payload as last time, no need to parse it again
+            log.debug('Daily Forecast response is unchanged')
+            self.daily_forecasts.next_refresh = self._get_daily_next_refresh(now)
+            self.daily_forecasts.fail_count = 0
         else:
             # Loop through all forecast items, adding them to a list
             new_forecasts = []
@@ -330,80 +491,100 @@ class AccuWeather(WeatherForecast):
             log.debug(f"Parsing {len(response['DailyForecasts'])} elements...")
             for item in response['DailyForecasts']:
                 forecast_date = item['Date']
-                forecast_datetime = datetime.strptime(forecast_date, '%Y-%m-%dT%H:%M:%S%z')
+                forecast_datetime = datetime.fromisoformat(forecast_date)
+
+                # Day and night share the same sunrise, sunset and temperatures
+                temperature = item['Temperature']
+                high_temperature = temperature['Maximum']['Value']
+                low_temperature = temperature['Minimum']['Value']
+
+                day_json = item['Day']
+                night_json = item['Night']
+
+                if self._details:
+                    sunrise_time = datetime.fromisoformat(item['Sun']['Rise'])
+                    sunset_time = datetime.fromisoformat(item['Sun']['Set'])
+
+                    real_feel = item['RealFeelTemperature']
+                    feels_like_high = real_feel['Maximum']['Value']
+                    feels_like_low = real_feel['Minimum']['Value']
+
+                    day_precipitation_probability = day_json['PrecipitationProbability']
+                    day_precipitation_amount = day_json['TotalLiquid']['Value']
+                    night_precipitation_probability = night_json['PrecipitationProbability']
+                    night_precipitation_amount = night_json['TotalLiquid']['Value']
+                else:
+                    sunrise_time = None
+                    sunset_time = None
+                    feels_like_high = None
+                    feels_like_low = None
+                    day_precipitation_probability = None
+                    day_precipitation_amount = None
+                    night_precipitation_probability = None
+                    night_precipitation_amount = None
 
-                day_precipitation_type = item['Day'].get('PrecipitationType', None)
-                day_precipitation_icon = self._precip_icon_map.get(str(day_precipitation_type).lower(), '\uf084')
+                day_precipitation_type = day_json.get('PrecipitationType', None)
+                day_precipitation_icon = self._precip_icons.get(day_precipitation_type, '\uf084')
 
-                night_precipitation_type = item['Night'].get('PrecipitationType', None)
-                night_precipitation_icon = self._precip_icon_map.get(str(night_precipitation_type).lower(), '\uf084')
+                night_precipitation_type = night_json.get('PrecipitationType', None)
+                night_precipitation_icon = self._precip_icons.get(night_precipitation_type, '\uf084')
 
                 # Day
                 day = ForecastData(
                     forecast_datetime= forecast_datetime
                     , is_nighttime_forecast= False
-                    , high_temperature= item['Temperature']['Maximum']['Value']
-                    , low_temperature= item['Temperature']['Minimum']['Value']
-                    , feels_like_high = item['RealFeelTemperature']['Maximum']['Value']
-                    , feels_like_low = item['RealFeelTemperature']['Minimum']['Value']
+                    , high_temperature= high_temperature
+                    , low_temperature= low_temperature
+                    , feels_like_high = feels_like_high
+                    , feels_like_low = feels_like_low
 
                     , precipitation_type= day_precipitation_type
                     , precipitation_icon= day_precipitation_icon
-                    , precipitation_probability= item['Day']['PrecipitationProbability']
-                    , precipitation_amount=item['Day']['TotalLiquid']['Value']
+                    , precipitation_probability= day_precipitation_probability
+                    , precipitation_amount= day_precipitation_amount
 
-                    , weather_icon_raw = item['Day']['Icon']
-                    , weather_icon= self._weather_icon_map[item['Day']['Icon']]
-                    , weather_text= item['Day']['ShortPhrase']
+                    , weather_icon_raw = day_json['Icon']
+                    , weather_icon= self._weather_icons[day_json['Icon']]
+                    , weather_text= day_json['ShortPhrase'] if self._details else day_json['IconPhrase']
 
-                    , sunrise_time= datetime.strptime(item['Sun']['Rise'], '%Y-%m-%dT%H:%M:%S%z')
-                    , sunset_time= datetime.strptime(item['Sun']['Set'], '%Y-%m-%dT%H:%M:%S%z')
+                    , sunrise_time= sunrise_time
+                    , sunset_time= sunset_time
                 )
 
                 # Night
                 night = ForecastData(
                     forecast_datetime= forecast_datetime
                     , is_nighttime_forecast= True
-                    , high_temperature= item['Temperature']['Maximum']['Value']
-                    , low_temperature= item['Temperature']['Minimum']['Value']
-                    , feels_like_high = item['RealFeelTemperature']['Maximum']['Value']
-                    , feels_like_low = item['RealFeelTemperature']['Minimum']['Value']
+                    , high_temperature= high_temperature
+                    , low_temperature= low_temperature
+                    , feels_like_high = feels_like_high
+                    , feels_like_low = feels_like_low
 
                     , precipitation_type= night_precipitation_type
                     , precipitation_icon= night_precipitation_icon
-                    , precipitation_probability= item['Night']['PrecipitationProbability']
-                    , precipitation_amount=item['Night']['TotalLiquid']['Value']
+                    , precipitation_probability= night_precipitation_probability
+                    , precipitation_amount= night_precipitation_amount
 
-                    , weather_icon_raw = item['Night']['Icon']
-                    , weather_icon= self._weather_icon_map[item['Night']['Icon']]
-                    , weather_text= item['Night']['ShortPhrase']
+                    , weather_icon_raw = night_json['Icon']
+                    , weather_icon= self._weather_icons[night_json['Icon']]
+                    , weather_text= night_json['ShortPhrase'] if self._details else night_json['IconPhrase']
 
-                    , sunrise_time= datetime.strptime(item['Sun']['Rise'], '%Y-%m-%dT%H:%M:%S%z')
-                    , sunset_time= datetime.strptime(item['Sun']['Set'], '%Y-%m-%dT%H:%M:%S%z')
+                    , sunrise_time= sunrise_time
+                    , sunset_time= sunset_time
                 )
 
                 new_forecasts.append(day)
                 new_forecasts.append(night)
 
-            # Set next refresh to 6 am/pm, whichever comes first
-            if datetime.now().hour > 6 and datetime.now().hour < 18:
-                refresh_hour = 17
-            else:
-                refresh_hour = 5
-
-            next_refresh = datetime.combine(date.today(), time(refresh_hour, 0))
-            if next_refresh < datetime.now():
-                next_refresh += timedelta(days=1)
-
             forecast_collection = ForecastDataCollection(
                 forecasts= new_forecasts
-                # Set forecast refresh time to 1 hour from now
-                , next_refresh= next_refresh
+                , next_refresh= self._get_daily_next_refresh(now)
+                , digest= digest
             )
 
             # If response doesn't match existing data, indicate that the forecast was updated
             # Always update the object so next_refresh is accurate
-            if self.current_conditions != forecast_collection:
+            if self.daily_forecasts != forecast_collection:
                 forecast_updated = True
 
             self.daily_forecasts = forecast_collection
@@ -411,6 +592,39 @@ class AccuWeather(WeatherForecast):
         log.debug('Exiting _get_daily_forecast()')
         return forecast_updated
 
+    def _schedule_retry(self, collection, request_name, now):
+        '''
+            Sets the next refresh for a collection after a failed request
+
+            The delay doubles with each failure in a row, up to RETRY_DELAY_MAX
+            Up to a minute of jitter keeps the collections from all retrying
+            at the same moment once the service recovers
+        '''
+        delay = min(RETRY_DELAY * 2 ** collection.fail_count, RETRY_DELAY_MAX)
+        new_refresh = now + delay + timedelta(seconds= random.uniform(0, 60))
+
+        collection.fail_count += 1
+        collection.next_refresh = new_refresh
+
+        log.error(f'{request_name} request failed ({collection.fail_count} in a row). '
+                    f'Setting next refresh for {new_refresh}.')
+
+    def _get_daily_next_refresh(self, now):
+        '''
+            Returns the next daily forecast refresh after now, 5 am or 5 pm,
+            whichever comes first
+        '''
+        if 6 < now.hour < 18:
+            refresh_hour = 17
+        else:
+            refresh_hour = 5
+
+        next_refresh = datetime.combine(now.date(), time(refresh_hour, 0))
+        if next_refresh < now:
+            next_refresh += timedelta(days=1)
+
+        return next_refresh
+
     def _get_needed_refresh_methods(self):
         '''
             Returns a list of all methods that need to be called to refresh object
@@ -418,9 +632,11 @@ class AccuWeather(WeatherForecast):
         '''
         log.debug('Entering _get_needed_refresh_methods()')
 
+        now = datetime.now()
+
         update_methods_to_invoke = []
 
-        adjusted_time = datetime.now() + timedelta(minutes= self.refresh_tolerance_mins)
+        adjusted_time = now + timedelta(minutes= self.refresh_tolerance_mins)
 
         if adjusted_time > self.current_conditions.next_refresh:
             update_methods_to_invoke.append(self._get_current_conditions)
@@ -447,14 +663,63 @@ class AccuWeather(WeatherForecast):
         '''
         log.debug('Entering refresh()')
 
+        now = datetime.now()
+
         has_changed = False
 
         update_methods_to_invoke = self._get_needed_refresh_methods()
 
+        # Don't spend time on AccuWeather requests that are sure to be refused
+        # Alerts come from the NWS, so they're still requested
+        # The count is only updated by a response, and the quota resets daily,
+        # so try again an hour after the calls ran out. The next response
+        # either clears the exhausted state or starts the hour over
+        if not self.can_call():
+            # Sessions pickled without the timestamp start the hour now
+            if self._calls_exhausted_at is None:
+                self._calls_exhausted_at = now
+
+            new_refresh = self._calls_exhausted_at + timedelta(hours=1)
+            if now < new_refresh:
+                log.error(f'No AccuWeather API calls remaining. Setting next refresh for {new_refresh}.')
+
+                for collection in (self.current_conditions, self.hourly_forecasts, self.daily_forecasts):
+                    collection.next_refresh = max(collection.next_refresh, new_refresh)
+
+                update_methods_to_invoke = [method for method in update_methods_to_invoke
+                                            if method == self._get_alerts]
+
+        # The AccuWeather end points are built from the location key
+        # Look it up here, before the threads start, so they only ever read it
+        # If it fails, that's the only failed request, so schedule one retry
+        # for each collection that was due and skip their requests
+        if (self._location_key is None
+                and any(method != self._get_alerts for method in update_methods_to_invoke)
+                and not self._get_location_key()):
+            log.error('Location Key lookup failed. Skipping the AccuWeather requests.')
+
+            for method, collection in (
+                (self._get_current_conditions, self.current_conditions)
+                , (self._get_hourly_forecast, self.hourly_forecasts)
+                , (self._get_daily_forecast, self.daily_forecasts)
+            ):
+                if method in update_methods_to_invoke:
+                    self._schedule_retry(collection, 'Location Key', now)
+
+            update_methods_to_invoke = [method for method in update_methods_to_invoke
+                                        if method == self._get_alerts]
+
         log.debug(f'update_methods_to_invoke has {len(update_methods_to_invoke)} items')
-        for method in update_methods_to_invoke:
-            has_changed_new = method()
-            has_changed = has_changed or has_changed_new
+        if update_methods_to_invoke:
+            # Each method hits its own endpoint and updates its own collection,
+            # so make the requests at the same time rather than one after another
+            # result() re-raises any exception from the method
+            with ThreadPoolExecutor(max_workers= len(update_methods_to_invoke)) as executor:
+                futures = [executor.submit(method) for method in update_methods_to_invoke]
+
+                for future in futures:
+                    has_changed_new = future.result()
+                    has_changed = has_changed or has_changed_new
 
         log.debug(f'Exiting refresh() with status {has_changed}')
         return has_changed
\ No newline at end of file
@@ -15,6 +15,9 @@ class Temperature():
         A simple class to make it easier to display rounded temperatures
         with a degree symbol
     '''
+    # Every ForecastData holds six of these
+    __slots__ = ('temperature',)
+
     def __init__(self, temperature = None):
         self.temperature = temperature
 
@@ -40,6 +43,17 @@ class ForecastData():
     '''
         Class for storing specific weather for a datetime
     '''
+    # A couple dozen of these are made for every refresh, skip the instance dicts
+    __slots__ = (
+        'forecast_datetime', 'is_nighttime_forecast'
+        , 'current_temperature', 'feels_like_temperature'
+        , 'weather_icon_raw', 'weather_icon', 'weather_text', 'relative_humidity'
+        , 'high_temperature', 'low_temperature', 'feels_like_high', 'feels_like_low'
+        , 'precipitation_type', 'precipitation_icon'
+        , 'precipitation_probability', 'precipitation_amount'
+        , 'sunrise_time', 'sunset_time'
+    )
+
     def __init__(self, forecast_datetime = None
                 , is_nighttime_forecast = None
                 , current_temperature = None
@@ -86,32 +100,33 @@ class ForecastData():
             Otherwise two items will never be equal
         '''
 
-        # Some services give the current forecast's time as the current time
-        # See if the forecast snapshots are within an hour of each other
-        if self.forecast_datetime is None or right_operand.forecast_datetime is None:
-            forecast_seconds_diff = 9999
-        else:
-            forecast_seconds_diff = (right_operand.forecast_datetime - self.forecast_datetime).total_seconds()
-
-        return (
-            forecast_seconds_diff < 3600
-            and self.is_nighttime_forecast == right_operand.is_nighttime_forecast
-            and self.current_temperature == right_operand.current_temperature
-            and self.feels_like_temperature == right_operand.feels_like_temperature
-            and self.weather_icon_raw == right_operand.weather_icon_raw
-            and self.weather_icon == right_operand.weather_icon
+        # Plain fields that change the most are compared first, so differing
+        # forecasts are usually ruled out before the Temperature comparisons
+        if not (
+            self.weather_icon_raw == right_operand.weather_icon_raw
             and self.weather_text == right_operand.weather_text
+            and self.precipitation_probability == right_operand.precipitation_probability
             and self.relative_humidity == right_operand.relative_humidity
+            and self.precipitation_amount == right_operand.precipitation_amount
+            and self.precipitation_type == right_operand.precipitation_type
+            and self.weather_icon == right_operand.weather_icon
+            and self.is_nighttime_forecast == right_operand.is_nighttime_forecast
 
+            and self.current_temperature == right_operand.current_temperature
+            and self.feels_like_temperature == right_operand.feels_like_temperature
             and self.high_temperature == right_operand.high_temperature
             and self.low_temperature == right_operand.low_temperature
             and self.feels_like_high == right_operand.feels_like_high
             and self.feels_like_low == right_operand.feels_like_low
+        ):
+            return False
 
-            and self.precipitation_type == right_operand.precipitation_type
-            and self.precipitation_probability == right_operand.precipitation_probability
-            and self.precipitation_amount == right_operand.precipitation_amount
-        )
+        # Some services give the current forecast's time as the current time
+        # See if the forecast snapshots are within an hour of each other
+        if self.forecast_datetime is None or right_operand.forecast_datetime is None:
+            return False
+
+        return (right_operand.forecast_datetime - self.forecast_datetime).total_seconds() < 3600
 
     def __repr__(self):
         precip_display = ''
@@ -136,11 +151,23 @@ class ForecastData():
 class ForecastDataCollection():
     '''
         A collection of ForecastData objects
+
+        digest identifies the API response the forecasts were parsed from,
+        None if unknown
     '''
 
-    def __init__(self, forecasts=[], next_refresh=datetime.min):
-        self.forecasts = forecasts
+    def __init__(self, forecasts=None, next_refresh=datetime.min, digest=None):
+        # Default to a new list, a [] default would be shared by every collection
+        self.forecasts = [] if forecasts is None else forecasts
         self.next_refresh = next_refresh
+        self.digest = digest
+        # Requests for this collection that have failed in a row
+        self.fail_count = 0
 
     def __eq__(self, right_operand):
+        # Forecasts parsed from the same response are equal,
+        # skip comparing them one field at a time
+        if self.digest is not None and self.digest == right_operand.digest:
+            return True
+
         return self.forecasts == right_operand.forecasts
\ No newline at end of file
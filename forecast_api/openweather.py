@@ -17,6 +17,121 @@ import requests
 
 log = logging.getLogger(__name__)
 
+# Weather font glyph for each OpenWeather icon, and for specific conditions within it
+# The map doesn't change, so it's shared rather than built (and pickled) for every object
+WEATHER_ICON_MAP = {
+    # https://openweathermap.org/weather-conditions#Weather-Condition-Codes-2
+
+    # Clear - Day
+    '01d': {'default': '\uf00d'},   # wi-day-sunny
+    # Clear - Night
+    '01n': {'default': '\uf02e'},   # wi-night-clear
+
+    # Few Clouds (11-25%) - Day
+    '02d': {'default': '\uf002'},   # wi-day-cloudy
+    # Few Clouds (11-25%) - Night
+    '02n': {'default': '\uf086'},   # wi-night-alt-cloudy
+
+    # Scattered Clouds (25-50%) - Day
+    '03d': {'default': '\uf041'},   # wi-cloud
+    # Scattered Clouds (25-50%) - Night
+    '03n': {'default': '\uf041'},   # wi-cloud
+
+    # Broken Clouds (51%+) - Day
+    '04d': {'default': '\uf013'},   # wi-cloudy
+    # Broken Clouds (51%+) - Night
+    '04n': {'default': '\uf013'},   # wi-cloudy
+
+    # Drizzle - Day
+    '09d': {'default': '\uf009'},   # wi-day-showers
+    # Drizzle - Night
+    '09n': {'default': '\uf029'},   # wi-night-alt-showers
+
+    # Rain - Day
+    '10d': {
+        'default': '\uf008',        # wi-day-rain
+        # light rain
+        500: '\uf009',              # wi-day-showers
+        # freezing rain
+        511: '\uf006',              # wi-day-rain-mix
+
+        # light intensity shower rain
+        520: '\uf019',              # wi-rain
+        # shower rain
+        521: '\uf019',              # wi-rain
+        # heavy intensity shower rain
+        522: '\uf019',              # wi-rain
+        # ragged shower rain
+        531: '\uf019'               # wi-rain
+
+    },
+    # Rain - Night
+    '10n': {
+        'default': '\uf028',        # wi-night-alt-rain
+        # light rain
+        500: '\uf029',            # wi-night-alt-showers
+        # freezing rain
+        511: '\uf026',            # wi-night-alt-rain-mix
+
+        # light intensity shower rain
+        520: '\uf019',              # wi-rain
+        # shower rain
+        521: '\uf019',              # wi-rain
+        # heavy intensity shower rain
+        522: '\uf019',              # wi-rain
+        # ragged shower rain
+        531: '\uf019'               # wi-rain
+    },
+
+    # Thunderstorm - Day
+    '11d': {'default': '\uf01e'},   # wi-thunderstorm
+    # Thunderstorm - Night
+    '11n': {'default': '\uf01e'},   # wi-thunderstorm
+
+    # Snow - Day
+    '13d': {
+        'default': '\uf00a',                # wi-day-snow
+        'heavy snow': '\uf01b',             # wi-snow
+        'sleet': '\uf0b2',                  # wi-day-sleet
+        'light rain and snow': '\uf0b2',    # wi-day-sleet
+        'rain and snow': '\uf0b2',          # wi-day-sleet
+        'light shower snow': '\uf0b2',      # wi-day-sleet
+        'shower snow': '\uf0b2',            # wi-day-sleet
+        'heavy shower snow': '\uf0b5'       # wi-sleet
+    },
+    # Snow - Night
+    '13n': {
+        'default': '\uf02a',                # wi-night-alt-snow
+        'heavy snow': '\uf01b',             # wi-snow
+        'sleet': '\uf0b4',                  # wi-night-alt-sleet
+        'light rain and snow': '\uf0b4',    # wi-night-alt-sleet
+        'rain and snow': '\uf0b4',          # wi-night-alt-sleet
+        'light shower snow': '\uf0b4',      # wi-night-alt-sleet
+        'shower snow': '\uf0b4',            # wi-night-alt-sleet
+        'heavy shower snow': '\uf0b5'       # wi-sleet
+    },
+
+    # Mist, etc - Day
+    '50d': {
+        'default': '\uf0b6',        # wi-day-haze
+        'fog': '\uf003',            # wi-day-fog
+        'squalls': '\uf085',        # wi-day-windy
+        'tornado': '\uf056'         # wi-tornado
+
+
+    },
+    # Mist, etc - Night
+    '50n': {
+        'default': '\uf063',        # wi-dust
+        'fog': '\uf04a',            # wi-night-fog
+        'squalls': '\uf02f',        # wi-night-cloudy-gusts
+        'tornado': '\uf056'         # wi-tornado
+    },
+
+    # For anything unmapped, use the Alien icon
+    'unknown': '\uf075'             # wi-alien
+}
+
 class OpenWeather(WeatherForecast):
     def __init__(self, api_key, unit_type, lat_long, time_zone, lang):
         self._MAX_API_CALLS = 1000 # Service offers 1,000 per day for free
@@ -36,118 +151,7 @@ class OpenWeather(WeatherForecast):
         self._base_url = 'https://api.openweathermap.org/data/3.0/'
         self._timezone_offset = 0
 
-        self._weather_icon_map = {
-            # https://openweathermap.org/weather-conditions#Weather-Condition-Codes-2
-
-            # Clear - Day
-            '01d': {'default': '\uf00d'},   # wi-day-sunny
-            # Clear - Night
-            '01n': {'default': '\uf02e'},   # wi-night-clear
-
-            # Few Clouds (11-25%) - Day
-            '02d': {'default': '\uf002'},   # wi-day-cloudy
-            # Few Clouds (11-25%) - Night
-            '02n': {'default': '\uf086'},   # wi-night-alt-cloudy
-
-            # Scattered Clouds (25-50%) - Day
-            '03d': {'default': '\uf041'},   # wi-cloud
-            # Scattered Clouds (25-50%) - Night
-            '03n': {'default': '\uf041'},   # wi-cloud
-
-            # Broken Clouds (51%+) - Day
-            '04d': {'default': '\uf013'},   # wi-cloudy
-            # Broken Clouds (51%+) - Night
-            '04n': {'default': '\uf013'},   # wi-cloudy
-
-            # Drizzle - Day
-            '09d': {'default': '\uf009'},   # wi-day-showers
-            # Drizzle - Night
-            '09n': {'default': '\uf029'},   # wi-night-alt-showers
-
-            # Rain - Day
-            '10d': {
-                'default': '\uf008',        # wi-day-rain
-                # light rain
-                500: '\uf009',              # wi-day-showers
-                # freezing rain
-                511: '\uf006',              # wi-day-rain-mix
-
-                # light intensity shower rain
-                520: '\uf019',              # wi-rain
-                # shower rain
-                521: '\uf019',              # wi-rain
-                # heavy intensity shower rain
-                522: '\uf019',              # wi-rain
-                # ragged shower rain
-                531: '\uf019'               # wi-rain
-
-            },
-            # Rain - Night
-            '10n': {
-                'default': '\uf028',        # wi-night-alt-rain
-                # light rain
-                500: '\uf029',            # wi-night-alt-showers
-                # freezing rain
-                511: '\uf026',            # wi-night-alt-rain-mix
-
-                # light intensity shower rain
-                520: '\uf019',              # wi-rain
-                # shower rain
-                521: '\uf019',              # wi-rain
-                # heavy intensity shower rain
-                522: '\uf019',              # wi-rain
-                # ragged shower rain
-                531: '\uf019'               # wi-rain
-            },
-
-            # Thunderstorm - Day
-            '11d': {'default': '\uf01e'},   # wi-thunderstorm
-            # Thunderstorm - Night
-            '11n': {'default': '\uf01e'},   # wi-thunderstorm
-
-            # Snow - Day
-            '13d': {
-                'default': '\uf00a',                # wi-day-snow
-                'heavy snow': '\uf01b',             # wi-snow
-                'sleet': '\uf0b2',                  # wi-day-sleet
-                'light rain and snow': '\uf0b2',    # wi-day-sleet
-                'rain and snow': '\uf0b2',          # wi-day-sleet
-                'light shower snow': '\uf0b2',      # wi-day-sleet
-                'shower snow': '\uf0b2',            # wi-day-sleet
-                'heavy shower snow': '\uf0b5'       # wi-sleet
-            },
-            # Snow - Night
-            '13n': {
-                'default': '\uf02a',                # wi-night-alt-snow
-                'heavy snow': '\uf01b',             # wi-snow
-                'sleet': '\uf0b4',                  # wi-night-alt-sleet
-                'light rain and snow': '\uf0b4',    # wi-night-alt-sleet
-                'rain and snow': '\uf0b4',          # wi-night-alt-sleet
-                'light shower snow': '\uf0b4',      # wi-night-alt-sleet
-                'shower snow': '\uf0b4',            # wi-night-alt-sleet
-                'heavy shower snow': '\uf0b5'       # wi-sleet
-            },
-
-            # Mist, etc - Day
-            '50d': {
-                'default': '\uf0b6',        # wi-day-haze
-                'fog': '\uf003',            # wi-day-fog
-                'squalls': '\uf085',        # wi-day-windy
-                'tornado': '\uf056'         # wi-tornado
-
-
-            },
-            # Mist, etc - Night
-            '50n': {
-                'default': '\uf063',        # wi-dust
-                'fog': '\uf04a',            # wi-night-fog
-                'squalls': '\uf02f',        # wi-night-cloudy-gusts
-                'tornado': '\uf056'         # wi-tornado
-            },
-
-            # For anything unmapped, use the Alien icon
-            'unknown': '\uf075'             # wi-alien
-        }
+        self._session = self._build_session()
 
     def _get_weather_icon(self, icon_name, description='default'):
         '''
@@ -162,7 +166,7 @@ class OpenWeather(WeatherForecast):
 
         try:
             # Attempt to get the dictonary for the specified icon (e.g. "10d")
-            icon_dict = self._weather_icon_map.get(icon_name)
+            icon_dict = WEATHER_ICON_MAP.get(icon_name)
 
             # If the icon is valid, a dictionary will be returned
             if isinstance(icon_dict, dict):
@@ -175,7 +179,7 @@ class OpenWeather(WeatherForecast):
         finally:
             # If we didn't manage to find a glyph, use the unknown glyph instead
             if not weather_icon:
-                weather_icon = self._weather_icon_map['unknown']
+                weather_icon = WEATHER_ICON_MAP['unknown']
 
         return weather_icon
 
@@ -202,13 +206,16 @@ class OpenWeather(WeatherForecast):
             'exclude': 'minutely,alerts'
         }
 
+        response = None
         try:
-            response = requests.get(url, params=params)
+            response = self._session.get(url, params=params, timeout= REQUEST_TIMEOUT)
             response.raise_for_status()
         except Exception as err: #requests.exceptions.HTTPError as err:
             log.exception('Request failed.')
 
-            self._log_response_details(response)
+            # Timeouts and connection errors leave nothing to look at
+            if response is not None:
+                self._log_response_details(response)
 
             new_refresh = datetime.now() + timedelta(hours=1)
             log.error(f'OpenWeather request failed. Setting next refresh for {new_refresh}.')
@@ -224,9 +231,10 @@ class OpenWeather(WeatherForecast):
             j = response.json()
             self._timezone_offset = j.get('timezone_offset', 0)
 
-            current_refresh = self._parse_current_conditions(j['current'])
-            hourly_refresh = self._parse_hourly_conditions(j['hourly'])
-            daily_refresh = self._parse_daily_conditions(j['daily'])
+            # Current conditions are a single forecast, parse them like a list of one
+            current_refresh = self._parse_collection([j['current']], 'current_conditions')
+            hourly_refresh = self._parse_collection(j['hourly'], 'hourly_forecasts')
+            daily_refresh = self._parse_collection(j['daily'], 'daily_forecasts')
             alerts_refresh = self._get_alerts()
         except Exception:
             # Log exception and dump json to file for debugging
@@ -308,15 +316,20 @@ class OpenWeather(WeatherForecast):
             feels_like_max = max(feels_like_list)
             feels_like = feels_like['day']
 
+        # Only the first (primary) weather condition is used
+        weather = forecast_json['weather'][0]
+        weather_icon_raw = weather['icon']
+        weather_description = weather['description']
+
         # Current and Hourly do not have a summary
         # Use the weather.description element instead, convert to title case
         if 'summary' in forecast_json:
             weather_text = forecast_json['summary']
         else:
-            weather_text = str(forecast_json['weather'][0]['description']).title()
+            weather_text = str(weather_description).title()
 
         # Derive the icon from the icon + decription info
-        weather_icon = self._get_weather_icon(forecast_json['weather'][0]['icon'], forecast_json['weather'][0]['description'])
+        weather_icon = self._get_weather_icon(weather_icon_raw, weather_description)
 
         forecast = ForecastData(
             forecast_datetime= datetime.fromtimestamp(forecast_json['dt'])
@@ -336,7 +349,7 @@ class OpenWeather(WeatherForecast):
             , precipitation_amount= precipitation_accumulation
 
             , weather_text= weather_text
-            , weather_icon_raw= forecast_json['weather'][0]['icon']
+            , weather_icon_raw= weather_icon_raw
             , weather_icon= weather_icon
 
             , sunrise_time= sunrise
@@ -345,80 +358,18 @@ class OpenWeather(WeatherForecast):
 
         return forecast
 
-    def _parse_current_conditions(self, forecast_json, refresh_interval_minutes=60):
+    def _parse_collection(self, response, collection_name, refresh_interval_minutes=60):
         '''
-            Handles parsing current condition data and updating object
-        '''
-        log.debug('Entering _parse_current_conditions()')
-
-        forecast = self._parse_forecast(forecast_json)
-        forecast_collection = ForecastDataCollection(
-            forecasts= [forecast]
-            # Set forecast expiration time to 1 hour from now
-            , next_refresh= datetime.now()
-                            + timedelta(minutes=refresh_interval_minutes)
-        )
-
-        # If response matches existing data, indicate that the forecast wasn't updated
-        # Always update the object so next_refresh is accurate
-        if self.current_conditions == forecast_collection:
-            forecast_updated = False
-        else:
-            forecast_updated = True
-            log.debug(f'Current conditions updated. Next refresh: {str(self.current_conditions.next_refresh)}')
-
-        self.current_conditions = forecast_collection
+            Handles parsing a list of forecasts and updating the collection
+            named by collection_name (e.g. "hourly_forecasts")
 
-        log.debug('Exiting _parse_current_conditions()')
-        return forecast_updated
-
-    def _parse_hourly_conditions(self, response, refresh_interval_minutes=60):
-        '''
-            Handles parsing current condition data and updating object
+            Returns whether or not the collection changed
         '''
-        log.debug('Entering _parse_hourly_conditions()')
-
-        # Loop through all forecast items, adding them to a list
-        forecasts = []
+        log.debug(f'Entering _parse_collection() for {collection_name}')
 
         log.debug(f'Parsing {len(response)} elements...')
-        for item in response:
-            forecasts.append(self._parse_forecast(item))
-
-        forecast_collection = ForecastDataCollection(
-            forecasts= forecasts
-            # Set forecast expiration time to 1 hour from now
-            , next_refresh= datetime.now()
-                            + timedelta(minutes=refresh_interval_minutes)
-        )
-
-        # If response matches existing data, indicate that the forecast wasn't updated
-        # Always update the object so next_refresh is accurate
-        if self.hourly_forecasts == forecast_collection:
-            forecast_updated = False
-        else:
-            forecast_updated = True
-            log.debug(f'Hourly forecast updated. Next refresh: {str(self.hourly_forecasts.next_refresh)}')
-
-        self.hourly_forecasts = forecast_collection
-
-        log.debug('Exiting _parse_hourly_conditions()')
-        return forecast_updated
-
-    def _parse_daily_conditions(self, response, refresh_interval_minutes=60):
-        '''
-            Handles parsing current condition data and updating object
-        '''
-        log.debug('Entering _parse_daily_conditions()')
-
-        forecasts = []
-
-        log.debug(f'Parsing {len(response)} elements...')
-        for item in response:
-            forecasts.append(self._parse_forecast(item))
-
         forecast_collection = ForecastDataCollection(
-            forecasts= forecasts
+            forecasts= [self._parse_forecast(item) for item in response]
             # Set forecast expiration time to 1 hour from now
             , next_refresh= datetime.now()
                             + timedelta(minutes=refresh_interval_minutes)
@@ -426,15 +377,15 @@ class OpenWeather(WeatherForecast):
 
         # If response matches existing data, indicate that the forecast wasn't updated
         # Always update the object so next_refresh is accurate
-        if self.daily_forecasts == forecast_collection:
+        if getattr(self, collection_name) == forecast_collection:
             forecast_updated = False
         else:
             forecast_updated = True
-            log.debug(f'Daily forecast updated. Next refresh: {str(self.daily_forecasts.next_refresh)}')
+            log.debug(f'{collection_name} updated. Next refresh: {str(forecast_collection.next_refresh)}')
 
-        self.daily_forecasts = forecast_collection
+        setattr(self, collection_name, forecast_collection)
 
-        log.debug('Exiting _parse_daily_conditions()')
+        log.debug('Exiting _parse_collection()')
         return forecast_updated
 
     def refresh(self):
@@ -54,8 +54,9 @@ class WeatherAlertsCollection():
         A collection of WeatherAlert objects
     '''
 
-    def __init__(self, alerts=[], next_refresh=datetime.min):
-        self.alerts = alerts
+    def __init__(self, alerts=None, next_refresh=datetime.min):
+        # Default to a new list, a [] default would be shared by every collection
+        self.alerts = [] if alerts is None else alerts
         self.next_refresh = next_refresh
 
     def __eq__(self, right_operand):
@@ -14,12 +14,16 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 import logging
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from forecast_api.weatheralert import WeatherAlert, WeatherAlertsCollection
 from forecast_api.forecastdata import ForecastDataCollection
 
 log = logging.getLogger(__name__)
 
+# (connect, read) timeouts in seconds, so a stalled connection can't hang the refresh
+REQUEST_TIMEOUT = (3.05, 10)
+
 class WeatherForecast(ABC):
     '''
         Base class that for weather forecasting.
@@ -39,6 +43,7 @@ class WeatherForecast(ABC):
         self.nws_user_agent = nws_user_agent
 
         self._base_url = None
+        self._session = None # See _build_session()
 
         # Attributes
         self.city = None
@@ -90,6 +95,41 @@ class WeatherForecast(ABC):
         ''' To be implemented by derived class '''
         pass
 
+    def _build_session(self, headers=None, pool_maxsize=10):
+        '''
+            Returns a requests Session for a service's API calls
+            Keeping one session lets the connection be reused between requests
+
+            Server errors are retried with backoff. 429 isn't, since a daily
+            quota won't reset in time and every retry spends another call
+        '''
+        session = requests.Session()
+        if headers:
+            session.headers.update(headers)
+
+        adapter = HTTPAdapter(
+            pool_maxsize= pool_maxsize
+            , max_retries= Retry(
+                total= 3
+                , backoff_factor= 0.5
+                , status_forcelist= (500, 502, 503, 504)
+                , allowed_methods= frozenset(['GET'])
+                # Hand the last response back, so failures are handled as before
+                , raise_on_status= False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
+    def close(self):
+        '''
+            Closes the connections held by the session
+        '''
+        if self._session is not None:
+            self._session.close()
+
     def _log_response_details(self, response):
         log.debug('Response Headers:')
         for header, val in response.headers.items():
@@ -123,13 +163,16 @@ class WeatherForecast(ABC):
             , 'status': 'actual'
         }
 
+        response = None
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = requests.get(url, headers=headers, params=params, timeout= REQUEST_TIMEOUT)
             response.raise_for_status()
         except Exception as err: #requests.exceptions.HTTPError as err:
             log.exception(f'Alerts request failed.')
 
-            self._log_response_details(response)
+            # Timeouts and connection errors leave nothing to look at
+            if response is not None:
+                self._log_response_details(response)
 
             new_refresh = datetime.now() + timedelta(minutes=30)
             log.error(f'Weather.gov Alert request failed. Setting next refresh for {new_refresh}.')
@@ -145,13 +188,13 @@ class WeatherForecast(ABC):
             for item in j.get('features', []):
                 prop = item['properties']
                 effective_start_raw = prop['effective']
-                effective_start = datetime.strptime(effective_start_raw, '%Y-%m-%dT%H:%M:%S%z')
+                effective_start = datetime.fromisoformat(effective_start_raw)
                 # NWS returns a timezone aware datetime, already in local time
                 # Strip out the time zone so that comparisons don't break
                 effective_start = effective_start.replace(tzinfo=None)
 
                 effective_end_raw = prop['ends']
-                effective_end = datetime.strptime(effective_end_raw, '%Y-%m-%dT%H:%M:%S%z')
+                effective_end = datetime.fromisoformat(effective_end_raw)
                 effective_end = effective_end.replace(tzinfo=None)
 
                 new_alert = WeatherAlert(
@@ -204,6 +247,13 @@ class WeatherForecast(ABC):
                     , self.alerts.next_refresh
                 )
 
+    def can_call(self):
+        '''
+            Returns whether the last response left any API calls
+            api_calls_remaining is -1 when the count isn't known
+        '''
+        return self.api_calls_remaining != 0
+
     def get_daytime_forecasts(self):
         forecasts = self.daily_forecasts.forecasts
         return [f for f in forecasts if f.is_nighttime_forecast == False]